@@ -485,6 +485,9 @@ class CardData:
 @dataclass
 class Card:
     """Runtime card instance"""
+    # Class-level tag (not a field) for cheap card-vs-player dispatch
+    _is_card = True
+
     uid: str
     data: CardData
     owner: int  # Player index
@@ -525,6 +528,19 @@ class Card:
     def has_keyword(self, kw: Keyword) -> bool:
         return kw in self.effective_keywords
 
+    def has_keyword_by_name(self, name: str) -> bool:
+        """Check a keyword by its card-text name, e.g. "first strike"."""
+        kw = Keyword.from_string(name)
+        if not kw or kw in self.removed_keywords:
+            return False
+        if kw in self.data.keywords:
+            return True
+        # The layer system stores rules-side KeywordAbility flags here,
+        # so match the granted flag by member name
+        granted = self.granted_keywords
+        member = type(granted).__members__.get(kw.name)
+        return member is not None and member in granted
+
     def rest(self):
         self.is_rested = True
 
@@ -561,7 +577,7 @@ class Card:
 # CHASE/STACK ITEMS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ChaseItem:
     """An item on the chase (stack)"""
     uid: str
@@ -63,6 +63,7 @@ from .modals import (
 
 from .effects import (
     Effect,
+    CompoundEffect,
     EffectBuilder,
     ContinuousEffect,
     ReplacementEffect,
@@ -85,6 +86,7 @@ from .abilities import (
 from .priority import (
     PriorityManager,
     PendingAction,
+    ActionContext,
     ActionType,
     PriorityState,
 )
@@ -114,6 +116,7 @@ from .keywords import (
     Keyword,
     KeywordHandler,
     parse_keywords_from_text,
+    parse_keyword_bits,
 )
 
 from .replacement import (
@@ -160,14 +163,15 @@ __all__ = [
     'ModalChoice', 'Mode', 'ModalPatterns',
 
     # Effects
-    'Effect', 'EffectBuilder', 'ContinuousEffect', 'ReplacementEffect',
+    'Effect', 'CompoundEffect', 'EffectBuilder', 'ContinuousEffect', 'ReplacementEffect',
 
     # Abilities
     'Ability', 'ActivateAbility', 'AutomaticAbility', 'ContinuousAbility', 'WillAbility',
     'AbilityFactory',
 
     # Priority System (CR 604-605)
-    'PriorityManager', 'PendingAction', 'ActionType', 'PriorityState',
+    'PriorityManager', 'PendingAction', 'ActionContext', 'ActionType',
+    'PriorityState',
 
     # Cost System (CR 402, 1002)
     'CostManager', 'CostType', 'WillType', 'WillCost', 'AdditionalCost',
@@ -178,6 +182,7 @@ __all__ = [
 
     # Keyword System (CR 1100+)
     'KeywordManager', 'Keyword', 'KeywordHandler', 'parse_keywords_from_text',
+    'parse_keyword_bits',
 
     # Replacement Effects (CR 910)
     'ReplacementManager', 'ReplacementEffectCR', 'ReplacementEffectResult',
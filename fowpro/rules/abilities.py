@@ -105,6 +105,11 @@ class ActivateAbility(Ability):
     # Track if used this turn
     used_this_turn: bool = False
 
+    @property
+    def target_requirements(self) -> List[TargetRequirement]:
+        """Target requirements, under the name the priority system reads."""
+        return self.targets
+
     def can_play(self, game: 'GameEngine', card: 'Card', player: int) -> bool:
         """
         Check if this ability can be played.
@@ -294,11 +294,11 @@ class ChoiceManager:
 
         elif choice.choice_type == ChoiceType.MODAL:
             if choice.modal_choice:
-                available = choice.modal_choice.get_available_modes(
+                available = choice.modal_choice.get_available_indices(
                     self.game, self.game.get_card(choice.source_id), choice.player
                 )
                 if available:
-                    return [choice.modal_choice.modes.index(available[0])]
+                    return [min(available)]
             return [0]
 
         elif choice.choice_type == ChoiceType.TARGET:
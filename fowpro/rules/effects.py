@@ -10,9 +10,11 @@ References:
 - CR 1000+: Action by Rules
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Callable, Union, TYPE_CHECKING
-from enum import Enum
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Callable, Mapping, Tuple, Union, TYPE_CHECKING
+from enum import Enum, IntEnum
 
 from .types import EffectAction, EffectDuration, KeywordAbility
 from .targeting import TargetRequirement, TargetFilter
@@ -23,14 +25,23 @@ if TYPE_CHECKING:
     from ..engine import GameEngine
     from ..models import Card
 
+# Shared read-only params for effects that take none
+_EMPTY_PARAMS = MappingProxyType({})
 
-@dataclass
+# What a replacement that changes nothing about the event returns
+_NO_EVENT_CHANGES = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class Effect:
     """
     An effect that can be produced by an ability or spell.
 
     CR 901.3: An effect is a part of the game procedure produced by a
     resolved ability, or produced by a rule or a replacement effect.
+
+    Slotted: card scripts build one per ability per card, so per-instance
+    size matters more than ad-hoc attributes.
     """
     # What action this effect performs
     action: EffectAction
@@ -59,6 +70,27 @@ class Effect:
     # For effects that reference "it" or "that card"
     reference_target: Optional['Card'] = None
 
+    @classmethod
+    def _make(cls, action: EffectAction, params: Dict[str, Any] = _EMPTY_PARAMS,
+              duration: EffectDuration = EffectDuration.INSTANT) -> 'Effect':
+        """
+        Construct an effect without going through the dataclass __init__.
+
+        Fast path for EffectBuilder; fields not given take their defaults.
+        Keep in step with the field list above.
+        """
+        self = object.__new__(cls)
+        self.action = action
+        self.params = params
+        self.target = None
+        self.condition = None
+        self.modal = None
+        self.duration = duration
+        self.source = None
+        self.resolved_targets = []
+        self.reference_target = None
+        return self
+
     def execute(self, game: 'GameEngine', source: 'Card',
                 targets: List['Card'] = None, player: int = None) -> bool:
         """
@@ -503,6 +535,33 @@ class Effect:
         return True
 
 
+class CompoundEffect:
+    """
+    Several effects that resolve together as one, e.g. a +X/+Y buff.
+
+    Has the same execute() signature as Effect so it can sit in an
+    ability's effects list.
+    """
+    __slots__ = ('children', 'duration')
+
+    def __init__(self, children: List[Effect],
+                 duration: EffectDuration = EffectDuration.INSTANT):
+        self.children = children
+        self.duration = duration
+
+    def execute(self, game: 'GameEngine', source: 'Card',
+                targets: List['Card'] = None, player: int = None) -> bool:
+        """Execute each child effect in order."""
+        executed = False
+        for child in self.children:
+            if child.execute(game, source, targets, player):
+                executed = True
+        return executed
+
+    def __repr__(self) -> str:
+        return f"CompoundEffect({self.children!r})"
+
+
 class EffectLayer:
     """
     Effect layers per CR 909.1.
@@ -817,13 +876,14 @@ class ReplacementEffect:
     CR 910: Replacement effects change what happens.
     """
     # What event this replaces
-    replaces: str  # "destroy", "damage", "draw", etc.
+    replaces: Union[str, int]  # ReplacementType, "destroy", "damage", etc., or a custom event name
 
     # Condition for replacement
     condition: Optional[Condition] = None
 
-    # What happens instead
-    replacement: Callable[['GameEngine', 'Card', dict], Any] = None
+    # What happens instead. Returns a dict of changes to merge into the
+    # event data, or None for no changes.
+    replacement: Callable[['GameEngine', 'Card', dict], Optional[Dict[str, Any]]] = None
 
     # Source card UID
     source_id: int = 0
@@ -831,10 +891,14 @@ class ReplacementEffect:
     # Whether this has been applied this instance
     applied: bool = False
 
-    def can_replace(self, event_type: str, game: 'GameEngine',
+    # Specialized applicability check, built when registered with a manager
+    _fast_check: Optional[Callable[['GameEngine', 'Card', dict], bool]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def can_replace(self, event_type: Union[str, int], game: 'GameEngine',
                     card: 'Card', event_data: dict) -> bool:
         """Check if this replacement can apply."""
-        if self.replaces != event_type:
+        if _replacement_key(self.replaces) != _replacement_key(event_type):
             return False
 
         if self.condition:
@@ -845,38 +909,153 @@ class ReplacementEffect:
         return True
 
     def apply_replacement(self, game: 'GameEngine', card: 'Card',
-                          event_data: dict) -> Any:
-        """Apply this replacement effect."""
+                          event_data: dict) -> Mapping[str, Any]:
+        """
+        Apply this replacement effect. Always returns a mapping of changes;
+        non-mapping results (None, or e.g. True for "replaced") mean no
+        changes to the event data.
+        """
         if self.replacement:
-            return self.replacement(game, card, event_data)
-        return None
+            changes = self.replacement(game, card, event_data)
+            if isinstance(changes, Mapping):
+                return changes
+        return _NO_EVENT_CHANGES
+
+
+def _always_applies(game: 'GameEngine', card: 'Card', event_data: dict) -> bool:
+    return True
 
 
-class ReplacementType:
+def _make_replacement_check(effect: ReplacementEffect
+                            ) -> Callable[['GameEngine', 'Card', dict], bool]:
+    """
+    Build the applicability check for a registered replacement effect.
+
+    Equivalent to can_replace() for events from the effect's own bucket,
+    with the condition and source lookup bound up front.
+    """
+    condition = effect.condition
+    if not condition:
+        return _always_applies
+
+    source_id = effect.source_id
+
+    def check(game: 'GameEngine', card: 'Card', event_data: dict) -> bool:
+        source = game.get_card_by_uid(source_id)
+        if source:
+            return condition.check(game, source, source.controller)
+        return True
+
+    return check
+
+
+class ReplacementType(IntEnum):
     """
     Standard replacement effect types per CR 910.
+
+    Integer-valued so ReplacementEffectManager can index its buckets
+    directly; str() gives the event name used by ReplacementEffect.replaces.
     """
-    DAMAGE = "damage"          # "If X would deal damage"
-    DESTROY = "destroy"        # "If X would be destroyed"
-    DRAW = "draw"              # "If X would draw a card"
-    DISCARD = "discard"        # "If X would discard"
-    ENTER_FIELD = "enter_field"  # "If X would enter the field"
-    LEAVE_FIELD = "leave_field"  # "If X would leave the field"
-    LOSE_LIFE = "lose_life"    # "If X would lose life"
-    GAIN_LIFE = "gain_life"    # "If X would gain life"
-    REST = "rest"              # "If X would rest"
-    PUT_INTO_GRAVEYARD = "put_into_graveyard"  # "If X would be put into graveyard"
+    DAMAGE = 0              # "If X would deal damage"
+    DESTROY = 1             # "If X would be destroyed"
+    DRAW = 2                # "If X would draw a card"
+    DISCARD = 3             # "If X would discard"
+    ENTER_FIELD = 4         # "If X would enter the field"
+    LEAVE_FIELD = 5         # "If X would leave the field"
+    LOSE_LIFE = 6           # "If X would lose life"
+    GAIN_LIFE = 7           # "If X would gain life"
+    REST = 8                # "If X would rest"
+    PUT_INTO_GRAVEYARD = 9  # "If X would be put into graveyard"
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def coerce(cls, value: Union[str, int]) -> 'ReplacementType':
+        """Accept a member, its int value, or an event name like "damage"."""
+        if isinstance(value, str):
+            try:
+                return cls[value.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown replacement event type: {value!r}") from None
+        return cls(value)
+
+
+def _replacement_key(value: Union[str, int]) -> Union[ReplacementType, str]:
+    """
+    Bucket key for an event type: the ReplacementType member when there
+    is one, otherwise the event name itself (custom events like
+    "would_mill" are matched by exact name).
+    """
+    if isinstance(value, str):
+        try:
+            return ReplacementType[value.upper()]
+        except KeyError:
+            return value
+    return ReplacementType(value)
 
 
-@dataclass
+@dataclass(slots=True)
+class ReplacementEvent:
+    """
+    Typed payload for an event checked against replacement effects.
+
+    Replacement callables written against the old dict payloads keep
+    working: events support event['amount'], event['amount'] = n,
+    'amount' in event, event.get(...) and copy() (which returns a plain
+    dict). Keys are limited to the event's fields; unknown keys raise
+    KeyError on both read and write.
+    """
+    source: Optional['Card'] = None
+    target: Any = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def copy(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class DamageEvent(ReplacementEvent):
+    """"If X would deal damage" (ReplacementType.DAMAGE)."""
+    amount: int = 0
+
+
+@dataclass(slots=True)
+class DestroyEvent(ReplacementEvent):
+    """"If X would be destroyed" (ReplacementType.DESTROY)."""
+
+
+@dataclass(frozen=True)
 class ReplacementResult:
     """Result of applying a replacement effect."""
     was_replaced: bool = False
     replacement_applied: Optional[ReplacementEffect] = None
-    new_event_data: Dict[str, Any] = field(default_factory=dict)
+    # Only set when a replacement was applied
+    new_event_data: Optional[Dict[str, Any]] = None
     prevent_original: bool = False
 
 
+# Shared result for events no replacement applies to
+_NO_REPLACEMENT = ReplacementResult()
+
+
 class ReplacementEffectManager:
     """
     Manages replacement effects.
@@ -888,49 +1067,102 @@ class ReplacementEffectManager:
 
     def __init__(self):
         self.effects: List[ReplacementEffect] = []
+        # Buckets indexed by ReplacementType value. Tuples, rebuilt on
+        # add/remove, so a scan never sees a bucket change under it.
+        self.effects_by_type: List[Tuple[ReplacementEffect, ...]] = [
+            () for _ in ReplacementType]
+        # Buckets for event names outside ReplacementType, by exact name
+        self._effects_by_name: Dict[str, Tuple[ReplacementEffect, ...]] = {}
+        # Index by source so leave-field cleanup only touches that source
+        self._by_source: Dict[Any, List[ReplacementEffect]] = {}
 
     def add_effect(self, effect: ReplacementEffect) -> None:
         """Register a replacement effect."""
+        key = _replacement_key(effect.replaces)
+        effect._fast_check = _make_replacement_check(effect)
         self.effects.append(effect)
+        if isinstance(key, str):
+            self._effects_by_name[key] = self._effects_by_name.get(key, ()) + (effect,)
+        else:
+            self.effects_by_type[key] += (effect,)
+        self._by_source.setdefault(effect.source_id, []).append(effect)
 
-    def remove_effect(self, source_id) -> int:
+    def remove_effect(self, source_id: Any) -> int:
         """Remove all replacement effects from a source."""
-        original_len = len(self.effects)
-        self.effects = [e for e in self.effects if e.source_id != source_id]
-        return original_len - len(self.effects)
+        removed = self._by_source.pop(source_id, None)
+        if not removed:
+            return 0
+
+        for effect in removed:
+            self.effects.remove(effect)
+            key = _replacement_key(effect.replaces)
+            if isinstance(key, str):
+                remaining = tuple(
+                    e for e in self._effects_by_name[key] if e is not effect)
+                if remaining:
+                    self._effects_by_name[key] = remaining
+                else:
+                    del self._effects_by_name[key]
+            else:
+                self.effects_by_type[key] = tuple(
+                    e for e in self.effects_by_type[key] if e is not effect)
+        return len(removed)
+
+    def _find_replacement(self, bucket: Tuple[ReplacementEffect, ...],
+                          game: 'GameEngine', affected_card: 'Card',
+                          event_data: Union[ReplacementEvent, Dict[str, Any]]
+                          ) -> Optional[ReplacementEffect]:
+        """Return the first applicable effect in a bucket, or None."""
+        # Game state can't change mid-scan, so effects sharing a condition
+        # object and source can't pass once one of them has failed.
+        failed = None
+        for effect in bucket:
+            key = (id(effect.condition), effect.source_id)
+            if failed and key in failed:
+                continue
+            if effect._fast_check(game, affected_card, event_data):
+                return effect
+            if failed is None:
+                failed = set()
+            failed.add(key)
+        return None
 
-    def check_replacement(self, event_type: str, game: 'GameEngine',
-                          affected_card: 'Card', event_data: dict) -> ReplacementResult:
+    def check_replacement(self, event_type: Union[str, int], game: 'GameEngine',
+                          affected_card: 'Card',
+                          event_data: Union[ReplacementEvent, Dict[str, Any]]
+                          ) -> ReplacementResult:
         """
         Check if any replacement effect applies to an event.
 
         CR 910: If multiple replacements apply, affected card's controller chooses.
-        For now, we apply the first matching replacement.
+        For now, we apply the first matching replacement, so the scan stops
+        at the first hit. Letting the controller choose will need the full
+        list of applicable effects again.
         """
-        result = ReplacementResult()
-        result.new_event_data = event_data.copy()
-
-        # Find applicable replacements
-        applicable = []
-        for effect in self.effects:
-            if effect.can_replace(event_type, game, affected_card, event_data):
-                applicable.append(effect)
-
-        if not applicable:
-            return result
+        if isinstance(event_type, str):
+            event_type = _replacement_key(event_type)
+        if isinstance(event_type, str):
+            bucket = self._effects_by_name.get(event_type, ())
+        else:
+            bucket = self.effects_by_type[event_type]
+        if not bucket:
+            return _NO_REPLACEMENT
 
         # Apply first applicable replacement (CR 910 - controller would choose)
-        chosen = applicable[0]
-        replacement_result = chosen.apply_replacement(game, affected_card, event_data)
-
-        result.was_replaced = True
-        result.replacement_applied = chosen
-        result.prevent_original = True
+        chosen = self._find_replacement(bucket, game, affected_card, event_data)
+        if chosen is None:
+            return _NO_REPLACEMENT
 
-        if isinstance(replacement_result, dict):
-            result.new_event_data.update(replacement_result)
+        new_event_data = event_data.copy()
+        replacement_result = chosen.apply_replacement(game, affected_card, event_data)
+        new_event_data.update(replacement_result)
 
-        return result
+        return ReplacementResult(
+            was_replaced=True,
+            replacement_applied=chosen,
+            new_event_data=new_event_data,
+            prevent_original=True,
+        )
 
     def apply_damage_replacement(self, game: 'GameEngine', target: 'Card',
                                   amount: int, source: 'Card') -> int:
@@ -938,33 +1170,74 @@ class ReplacementEffectManager:
         Apply replacement effects to damage.
         Returns the actual damage amount after replacements.
         """
-        event_data = {
-            'amount': amount,
-            'source': source,
-            'target': target,
-        }
+        # Nothing replaces damage: skip building the event entirely
+        if not self.effects_by_type[ReplacementType.DAMAGE]:
+            return amount
+
+        event_data = DamageEvent(source=source, target=target, amount=amount)
 
         result = self.check_replacement(ReplacementType.DAMAGE, game, target, event_data)
 
         if result.was_replaced:
+            new_event_data = result.new_event_data or event_data
             # If prevented, return 0
-            if result.new_event_data.get('prevent', False):
+            if new_event_data.get('prevent', False):
                 return 0
             # If modified, return new amount
-            return result.new_event_data.get('amount', amount)
+            return new_event_data.get('amount', amount)
 
         return amount
 
+    def apply_damage_replacement_batch(self, game: 'GameEngine',
+                                       events: List[Tuple['Card', int, 'Card']]
+                                       ) -> List[int]:
+        """
+        Apply replacement effects to simultaneous damage events.
+
+        Takes (target, amount, source) triples, e.g. from a sweeper, and
+        returns the damage amounts after replacements in the same order.
+        Applicability depends only on each replacement's own source and
+        condition, so a scan that found nothing is reused for following
+        events. Once a replacement fires it may have changed game state
+        (e.g. a one-shot prevention), so the next event is scanned again.
+        """
+        bucket = self.effects_by_type[ReplacementType.DAMAGE]
+        if not bucket:
+            return [amount for _, amount, _ in events]
+
+        chosen = None
+        scanned = None
+        amounts = []
+        for target, amount, source in events:
+            event_data = DamageEvent(source=source, target=target, amount=amount)
+
+            bucket = self.effects_by_type[ReplacementType.DAMAGE]
+            if bucket is not scanned:
+                chosen = self._find_replacement(bucket, game, target, event_data)
+                scanned = bucket
+            if chosen is None:
+                amounts.append(amount)
+                continue
+
+            changes = chosen.apply_replacement(game, target, event_data)
+            scanned = None
+            if changes.get('prevent', False):
+                amounts.append(0)
+            else:
+                amounts.append(changes.get('amount', amount))
+
+        return amounts
+
     def apply_destroy_replacement(self, game: 'GameEngine', target: 'Card',
-                                   source: 'Card' = None) -> bool:
+                                   source: Optional['Card'] = None) -> bool:
         """
         Apply replacement effects to destruction.
         Returns True if destruction should proceed, False if replaced/prevented.
         """
-        event_data = {
-            'source': source,
-            'target': target,
-        }
+        if not self.effects_by_type[ReplacementType.DESTROY]:
+            return True
+
+        event_data = DestroyEvent(source=source, target=target)
 
         result = self.check_replacement(ReplacementType.DESTROY, game, target, event_data)
 
@@ -974,325 +1247,371 @@ class ReplacementEffectManager:
         return True
 
 
+# Read-only params shared by the zero-argument EffectBuilder factories.
+# Only the params are shared, not the Effect: execute() stores runtime
+# state (source, resolved_targets) on the instance.
+_PUT_INTO_FIELD_X_COST_PARAMS = MappingProxyType({'from_zone': 'hand', 'x_variable': True})
+_ALL_PARAMS = MappingProxyType({'all': True})
+_VARIABLE_PARAMS = MappingProxyType({'variable': True})
+_X_VARIABLE_PARAMS = MappingProxyType({'x_variable': True})
+_DEAL_DAMAGE_EQUAL_TO_ATK_PARAMS = MappingProxyType({'equal_to_atk': True})
+_DEAL_DAMAGE_MUTUAL_PARAMS = MappingProxyType({'mutual': True})
+_RETURN_FROM_GRAVEYARD_PARAMS = MappingProxyType({'from_zone': 'graveyard'})
+_GAIN_LIFE_EQUAL_TO_DAMAGE_PARAMS = MappingProxyType({'equal_to_damage': True})
+_PRODUCE_WILL_ANY_PARAMS = MappingProxyType({'any_color': True})
+_DYNAMIC_STATS_PARAMS = MappingProxyType({'dynamic': True})
+_DOUBLE_DAMAGE_PARAMS = MappingProxyType({'double_damage': True})
+_SWAP_STATS_PARAMS = MappingProxyType({'swap_stats': True})
+_DAMAGE_REPLACEMENT_PARAMS = MappingProxyType({'replacement': True})
+_FORCE_ATTACK_PARAMS = MappingProxyType({'force_attack': True})
+_FORCE_BLOCK_PARAMS = MappingProxyType({'force_block': True})
+_REDIRECT_PARAMS = MappingProxyType({'redirect': True})
+_GRANT_TO_OTHERS_PARAMS = MappingProxyType({'to_others': True})
+_END_OF_TURN_TRIGGER_PARAMS = MappingProxyType({'end_of_turn_trigger': True})
+_ON_TARGETED_TRIGGER_PARAMS = MappingProxyType({'on_targeted': True})
+_RESTRICTION_PARAMS = MappingProxyType({'restriction': True})
+_MOVE_ADDITION_PARAMS = MappingProxyType({'move': True})
+_PUT_ON_ADDED_DEATH_PARAMS = MappingProxyType({'on_added_death': True})
+_BANISH_SELF_CONDITIONAL_PARAMS = MappingProxyType({'self': True, 'conditional': True})
+_OPPONENT_BANISHES_PARAMS = MappingProxyType({'controller': 'opponent'})
+_PREVENT_RECOVERY_PARAMS = MappingProxyType({'prevent_recovery': True})
+_REVEAL_TOP_PARAMS = MappingProxyType({'from_top': True})
+_SECRET_CHOICE_PARAMS = MappingProxyType({'secret_choice': True})
+_PREVENT_NEXT_DAMAGE_PARAMS = MappingProxyType({'next_only': True})
+_PREVENT_ALL_BATTLE_DAMAGE_PARAMS = MappingProxyType({'all': True, 'battle_only': True})
+_COPY_SPELL_PARAMS = MappingProxyType({'type': 'spell'})
+_COPY_ENTITY_PARAMS = MappingProxyType({'type': 'entity'})
+_CALL_MAGIC_STONE_PARAMS = MappingProxyType({'call_stone': True})
+
+
+@lru_cache(maxsize=256)
+def _frozen_params(*items) -> MappingProxyType:
+    """Interned read-only params for factories called with hashable args."""
+    return MappingProxyType(dict(items))
+
+
 class EffectBuilder:
     """Builder for creating effects."""
 
     @staticmethod
     def deal_damage(amount: int, to_player: bool = False) -> Effect:
         """Deal damage to target(s)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DEAL_DAMAGE,
-            params={'amount': amount, 'to_player': to_player}
+            params=_frozen_params(('amount', amount), ('to_player', to_player))
         )
 
     @staticmethod
     def destroy() -> Effect:
         """Destroy target(s)."""
-        return Effect(action=EffectAction.DESTROY)
+        return Effect._make(action=EffectAction.DESTROY)
 
     @staticmethod
     def return_to_hand() -> Effect:
         """Return target(s) to owner's hand."""
-        return Effect(action=EffectAction.RETURN_TO_HAND)
+        return Effect._make(action=EffectAction.RETURN_TO_HAND)
 
     @staticmethod
     def draw(count: int = 1, player: str = 'you') -> Effect:
         """Draw cards."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DRAW,
-            params={'count': count, 'player': player}
+            params=_frozen_params(('count', count), ('player', player))
         )
 
     @staticmethod
     def discard(count: int = 1, random: bool = False) -> Effect:
         """Discard cards."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DISCARD,
-            params={'count': count, 'random': random}
+            params=_frozen_params(('count', count), ('random', random))
         )
 
     @staticmethod
     def gain_life(amount: int) -> Effect:
         """Gain life."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GAIN_LIFE,
-            params={'amount': amount}
+            params=_frozen_params(('amount', amount))
         )
 
     @staticmethod
     def lose_life(amount: int) -> Effect:
         """Lose life."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.LOSE_LIFE,
-            params={'amount': amount}
+            params=_frozen_params(('amount', amount))
         )
 
     @staticmethod
     def produce_will(attribute, count: int = 1) -> Effect:
         """Produce will."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PRODUCE_WILL,
-            params={'attribute': attribute, 'count': count}
+            params=_frozen_params(('attribute', attribute), ('count', count))
         )
 
     @staticmethod
     def rest() -> Effect:
         """Rest target(s)."""
-        return Effect(action=EffectAction.REST)
+        return Effect._make(action=EffectAction.REST)
 
     @staticmethod
     def recover() -> Effect:
         """Recover target(s)."""
-        return Effect(action=EffectAction.RECOVER)
+        return Effect._make(action=EffectAction.RECOVER)
 
     @staticmethod
     def add_counter(counter_type: str, count: int = 1) -> Effect:
         """Add counters."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.ADD_COUNTER,
-            params={'counter_type': counter_type, 'count': count}
+            params=_frozen_params(('counter_type', counter_type), ('count', count))
         )
 
     @staticmethod
-    def buff(atk: int = 0, def_: int = 0, duration: EffectDuration = EffectDuration.UNTIL_END_OF_TURN) -> Effect:
-        """Buff ATK/DEF."""
-        effects = []
+    def buff(atk: int = 0, def_: int = 0,
+             duration: EffectDuration = EffectDuration.UNTIL_END_OF_TURN
+             ) -> Union[Effect, CompoundEffect]:
+        """Buff ATK/DEF. Returns a CompoundEffect when both stats change."""
+        if atk and def_:
+            return CompoundEffect([
+                Effect._make(EffectAction.MODIFY_ATK,
+                             _frozen_params(('amount', atk)), duration),
+                Effect._make(EffectAction.MODIFY_DEF,
+                             _frozen_params(('amount', def_)), duration),
+            ], duration)
         if atk:
-            effects.append(Effect(
-                action=EffectAction.MODIFY_ATK,
-                params={'amount': atk},
-                duration=duration
-            ))
+            return Effect._make(EffectAction.MODIFY_ATK,
+                                _frozen_params(('amount', atk)), duration)
         if def_:
-            effects.append(Effect(
-                action=EffectAction.MODIFY_DEF,
-                params={'amount': def_},
-                duration=duration
-            ))
-        # Return first effect or create compound
-        return effects[0] if len(effects) == 1 else effects
+            return Effect._make(EffectAction.MODIFY_DEF,
+                                _frozen_params(('amount', def_)), duration)
+        return CompoundEffect([], duration)
 
     @staticmethod
     def grant_keyword(keyword: KeywordAbility,
                       duration: EffectDuration = EffectDuration.UNTIL_END_OF_TURN) -> Effect:
         """Grant a keyword."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_KEYWORD,
-            params={'keyword': keyword},
+            params=_frozen_params(('keyword', keyword)),
             duration=duration
         )
 
     @staticmethod
     def cancel() -> Effect:
         """Cancel target spell/ability."""
-        return Effect(action=EffectAction.CANCEL)
+        return Effect._make(action=EffectAction.CANCEL)
 
     @staticmethod
     def remove_from_game() -> Effect:
         """Remove from game."""
-        return Effect(action=EffectAction.REMOVE_FROM_GAME)
+        return Effect._make(action=EffectAction.REMOVE_FROM_GAME)
 
     @staticmethod
     def put_into_field(from_zone: str = 'hand') -> Effect:
         """Put a card into the field from a zone."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PUT_INTO_FIELD,
-            params={'from_zone': from_zone}
+            params=_frozen_params(('from_zone', from_zone))
         )
 
     @staticmethod
     def put_into_field_x_cost() -> Effect:
         """Put a card with cost X or less into the field."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PUT_INTO_FIELD,
-            params={'from_zone': 'hand', 'x_variable': True}
+            params=_PUT_INTO_FIELD_X_COST_PARAMS
         )
 
     @staticmethod
     def search(destination: str = 'hand', filter_type: str = None,
                filter_name: str = None, filter_race: str = None) -> Effect:
         """Search deck for a card."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SEARCH,
-            params={
-                'destination': destination,
-                'filter_type': filter_type,
-                'filter_name': filter_name,
-                'filter_race': filter_race,
-            }
+            params=_frozen_params(
+                ('destination', destination),
+                ('filter_type', filter_type),
+                ('filter_name', filter_name),
+                ('filter_race', filter_race),
+            )
         )
 
     @staticmethod
     def banish() -> Effect:
         """Banish target(s) - put into graveyard from field."""
-        return Effect(action=EffectAction.BANISH)
+        return Effect._make(action=EffectAction.BANISH)
 
     @staticmethod
     def prevent_damage(amount: int = 0, all_damage: bool = False) -> Effect:
         """Prevent damage."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PREVENT_DAMAGE,
-            params={'amount': amount, 'all': all_damage}
+            params=_frozen_params(('amount', amount), ('all', all_damage))
         )
 
     @staticmethod
     def gain_control() -> Effect:
         """Gain control of target."""
-        return Effect(action=EffectAction.GAIN_CONTROL)
+        return Effect._make(action=EffectAction.GAIN_CONTROL)
 
     @staticmethod
     def put_on_top_of_deck() -> Effect:
         """Put target on top of owner's deck."""
-        return Effect(action=EffectAction.PUT_ON_TOP_OF_DECK)
+        return Effect._make(action=EffectAction.PUT_ON_TOP_OF_DECK)
 
     @staticmethod
     def put_on_bottom_of_deck() -> Effect:
         """Put target on bottom of owner's deck."""
-        return Effect(action=EffectAction.PUT_ON_BOTTOM_OF_DECK)
+        return Effect._make(action=EffectAction.PUT_ON_BOTTOM_OF_DECK)
 
     @staticmethod
     def put_into_graveyard() -> Effect:
         """Put target into graveyard."""
-        return Effect(action=EffectAction.PUT_INTO_GRAVEYARD)
+        return Effect._make(action=EffectAction.PUT_INTO_GRAVEYARD)
 
     @staticmethod
     def shuffle_into_deck() -> Effect:
         """Shuffle target into owner's deck."""
-        return Effect(action=EffectAction.SHUFFLE_INTO_DECK)
+        return Effect._make(action=EffectAction.SHUFFLE_INTO_DECK)
 
     @staticmethod
     def reveal() -> Effect:
         """Reveal target card(s)."""
-        return Effect(action=EffectAction.REVEAL)
+        return Effect._make(action=EffectAction.REVEAL)
 
     @staticmethod
     def look_at(count: int = 1) -> Effect:
         """Look at top N cards of deck."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.LOOK,
-            params={'count': count}
+            params=_frozen_params(('count', count))
         )
 
     @staticmethod
     def set_atk(value: int) -> Effect:
         """Set ATK to a specific value."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SET_ATK,
-            params={'value': value}
+            params=_frozen_params(('value', value))
         )
 
     @staticmethod
     def set_def(value: int) -> Effect:
         """Set DEF to a specific value."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SET_DEF,
-            params={'value': value}
+            params=_frozen_params(('value', value))
         )
 
     @staticmethod
     def set_life(value: int) -> Effect:
         """Set player's life to a specific value."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SET_LIFE,
-            params={'value': value}
+            params=_frozen_params(('value', value))
         )
 
     @staticmethod
     def grant_ability(ability_text: str) -> Effect:
         """Grant an ability to target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'ability': ability_text}
+            params=_frozen_params(('ability', ability_text))
         )
 
     @staticmethod
     def remove_all_abilities() -> Effect:
         """Remove all abilities from target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_ABILITY,
-            params={'all': True}
+            params=_ALL_PARAMS
         )
 
     @staticmethod
     def copy_card() -> Effect:
         """Copy target card's characteristics."""
-        return Effect(action=EffectAction.COPY)
+        return Effect._make(action=EffectAction.COPY)
 
     @staticmethod
     def summon_token(name: str, atk: int, def_: int, **kwargs) -> Effect:
         """Summon a token creature."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SUMMON,
-            params={
-                'token_data': {
+            # Not interned: kwargs may be unhashable, and the token code
+            # is derived from the token_data identity
+            params=MappingProxyType({
+                'token_data': MappingProxyType({
                     'name': name,
                     'atk': atk,
                     'def': def_,
                     **kwargs
-                }
-            }
+                })
+            })
         )
 
     @staticmethod
     def remove_counter(counter_type: str, count: int = 1) -> Effect:
         """Remove counters from target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_COUNTER,
-            params={'counter_type': counter_type, 'count': count}
+            params=_frozen_params(('counter_type', counter_type), ('count', count))
         )
 
     @staticmethod
     def remove_damage(amount: int = 0, remove_all: bool = False) -> Effect:
         """Remove damage from target (healing)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_DAMAGE,
-            params={'amount': amount, 'all': remove_all}
+            params=_frozen_params(('amount', amount), ('all', remove_all))
         )
 
     @staticmethod
     def grant_attribute(attribute) -> Effect:
         """Grant an attribute to target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ATTRIBUTE,
-            params={'attribute': attribute}
+            params=_frozen_params(('attribute', attribute))
         )
 
     @staticmethod
     def remove_attribute(attribute) -> Effect:
         """Remove an attribute from target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_ATTRIBUTE,
-            params={'attribute': attribute}
+            params=_frozen_params(('attribute', attribute))
         )
 
     @staticmethod
     def set_attribute(attribute) -> Effect:
         """Set target's attribute (replacing all others)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SET_ATTRIBUTE,
-            params={'attribute': attribute}
+            params=_frozen_params(('attribute', attribute))
         )
 
     @staticmethod
     def grant_race(race: str) -> Effect:
         """Grant a race/trait to target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_RACE,
-            params={'race': race}
+            params=_frozen_params(('race', race))
         )
 
     @staticmethod
     def set_type(card_type) -> Effect:
         """Set target's card type."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SET_TYPE,
-            params={'type': card_type}
+            params=_frozen_params(('type', card_type))
         )
 
     @staticmethod
     def become_copy() -> Effect:
         """Make source become a copy of target."""
-        return Effect(action=EffectAction.BECOME_COPY)
+        return Effect._make(action=EffectAction.BECOME_COPY)
 
     # =========================================================================
     # Extended effect methods for CR-compliant script generation
@@ -1301,286 +1620,286 @@ class EffectBuilder:
     @staticmethod
     def draw_variable() -> Effect:
         """Draw cards equal to a variable amount (from game state)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DRAW,
-            params={'variable': True}
+            params=_VARIABLE_PARAMS
         )
 
     @staticmethod
     def deal_damage_x() -> Effect:
         """Deal X damage where X is from paid cost."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DEAL_DAMAGE,
-            params={'x_variable': True}
+            params=_X_VARIABLE_PARAMS
         )
 
     @staticmethod
     def deal_damage_equal_to_atk() -> Effect:
         """Deal damage equal to source's ATK."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DEAL_DAMAGE,
-            params={'equal_to_atk': True}
+            params=_DEAL_DAMAGE_EQUAL_TO_ATK_PARAMS
         )
 
     @staticmethod
     def deal_damage_variable() -> Effect:
         """Deal damage equal to a game state variable."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DEAL_DAMAGE,
-            params={'variable': True}
+            params=_VARIABLE_PARAMS
         )
 
     @staticmethod
     def deal_damage_mutual() -> Effect:
         """Source and target deal damage to each other."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DEAL_DAMAGE,
-            params={'mutual': True}
+            params=_DEAL_DAMAGE_MUTUAL_PARAMS
         )
 
     @staticmethod
     def return_from_graveyard() -> Effect:
         """Return target from graveyard to hand."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.RETURN_TO_HAND,
-            params={'from_zone': 'graveyard'}
+            params=_RETURN_FROM_GRAVEYARD_PARAMS
         )
 
     @staticmethod
     def gain_life_equal_to_damage() -> Effect:
         """Gain life equal to damage dealt."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GAIN_LIFE,
-            params={'equal_to_damage': True}
+            params=_GAIN_LIFE_EQUAL_TO_DAMAGE_PARAMS
         )
 
     @staticmethod
     def produce_will_any() -> Effect:
         """Produce will of any attribute."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PRODUCE_WILL,
-            params={'any_color': True}
+            params=_PRODUCE_WILL_ANY_PARAMS
         )
 
     @staticmethod
     def rest_x_targets() -> Effect:
         """Rest X target resonators where X is from paid cost."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REST,
-            params={'x_variable': True}
+            params=_X_VARIABLE_PARAMS
         )
 
     @staticmethod
     def scaling_buff(atk_per: int, def_per: int) -> Effect:
         """Buff that scales with game state (e.g., +X/+X for each card)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.MODIFY_ATK,
-            params={'atk_per': atk_per, 'def_per': def_per, 'scaling': True}
+            params=_frozen_params(('atk_per', atk_per), ('def_per', def_per), ('scaling', True))
         )
 
     @staticmethod
     def dynamic_stats() -> Effect:
         """ATK/DEF calculated dynamically from game state."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SET_ATK,
-            params={'dynamic': True}
+            params=_DYNAMIC_STATS_PARAMS
         )
 
     @staticmethod
     def double_damage() -> Effect:
         """Source deals double damage."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.MODIFY_ATK,
-            params={'double_damage': True}
+            params=_DOUBLE_DAMAGE_PARAMS
         )
 
     @staticmethod
     def swap_stats() -> Effect:
         """Swap ATK and DEF of target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.MODIFY_ATK,
-            params={'swap_stats': True}
+            params=_SWAP_STATS_PARAMS
         )
 
     @staticmethod
     def damage_replacement() -> Effect:
         """Replace damage with an alternative effect."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PREVENT_DAMAGE,
-            params={'replacement': True}
+            params=_DAMAGE_REPLACEMENT_PARAMS
         )
 
     @staticmethod
     def force_attack() -> Effect:
         """Target must attack if able."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'force_attack': True}
+            params=_FORCE_ATTACK_PARAMS
         )
 
     @staticmethod
     def force_block() -> Effect:
         """Target must block if able."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'force_block': True}
+            params=_FORCE_BLOCK_PARAMS
         )
 
     @staticmethod
     def redirect_target() -> Effect:
         """Change the target of a spell/ability."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'redirect': True}
+            params=_REDIRECT_PARAMS
         )
 
     @staticmethod
     def grant_to_others() -> Effect:
         """Grant an ability to other permanents you control."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'to_others': True}
+            params=_GRANT_TO_OTHERS_PARAMS
         )
 
     @staticmethod
     def end_of_turn_trigger() -> Effect:
         """Create an end-of-turn trigger effect."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'end_of_turn_trigger': True}
+            params=_END_OF_TURN_TRIGGER_PARAMS
         )
 
     @staticmethod
     def on_targeted_trigger() -> Effect:
         """Trigger when this becomes targeted."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'on_targeted': True}
+            params=_ON_TARGETED_TRIGGER_PARAMS
         )
 
     @staticmethod
     def play_restriction() -> Effect:
         """Restrict what can be played/summoned."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_ABILITY,
-            params={'restriction': True}
+            params=_RESTRICTION_PARAMS
         )
 
     @staticmethod
     def move_addition() -> Effect:
         """Move an Addition from one target to another."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'move': True}
+            params=_MOVE_ADDITION_PARAMS
         )
 
     @staticmethod
     def put_on_added_death() -> Effect:
         """Put added resonator into field when it dies."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PUT_INTO_FIELD,
-            params={'on_added_death': True}
+            params=_PUT_ON_ADDED_DEATH_PARAMS
         )
 
     @staticmethod
     def search_on_death(destination: str = 'hand') -> Effect:
         """Search when target goes to graveyard."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SEARCH,
-            params={'destination': destination, 'on_death': True}
+            params=_frozen_params(('destination', destination), ('on_death', True))
         )
 
     @staticmethod
     def banish_self_conditional() -> Effect:
         """Banish this card if condition is met."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.BANISH,
-            params={'self': True, 'conditional': True}
+            params=_BANISH_SELF_CONDITIONAL_PARAMS
         )
 
     @staticmethod
     def opponent_banishes() -> Effect:
         """Opponent banishes a card."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.BANISH,
-            params={'controller': 'opponent'}
+            params=_OPPONENT_BANISHES_PARAMS
         )
 
     @staticmethod
     def discard_all() -> Effect:
         """Discard all cards in hand."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.DISCARD,
-            params={'all': True}
+            params=_ALL_PARAMS
         )
 
     @staticmethod
     def remove_ability() -> Effect:
         """Remove a specific ability from target."""
-        return Effect(action=EffectAction.REMOVE_ABILITY)
+        return Effect._make(action=EffectAction.REMOVE_ABILITY)
 
     @staticmethod
     def add_restriction() -> Effect:
         """Add a play/summon restriction."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_ABILITY,
-            params={'restriction': True}
+            params=_RESTRICTION_PARAMS
         )
 
     @staticmethod
     def prevent_recovery() -> Effect:
         """Prevent target from recovering during recovery phase."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_ABILITY,
-            params={'prevent_recovery': True}
+            params=_PREVENT_RECOVERY_PARAMS
         )
 
     @staticmethod
     def reveal_top() -> Effect:
         """Reveal the top card of deck."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REVEAL,
-            params={'from_top': True}
+            params=_REVEAL_TOP_PARAMS
         )
 
     @staticmethod
     def secret_choice() -> Effect:
         """Make a secret choice (e.g., choose a number)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REVEAL,
-            params={'secret_choice': True}
+            params=_SECRET_CHOICE_PARAMS
         )
 
     @staticmethod
     def redirect_damage() -> Effect:
         """Redirect damage from one target to another."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PREVENT_DAMAGE,
-            params={'redirect': True}
+            params=_REDIRECT_PARAMS
         )
 
     @staticmethod
     def prevent_next_damage() -> Effect:
         """Prevent the next damage that would be dealt."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PREVENT_DAMAGE,
-            params={'next_only': True}
+            params=_PREVENT_NEXT_DAMAGE_PARAMS
         )
 
     @staticmethod
     def prevent_all_battle_damage() -> Effect:
         """Prevent all battle damage."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PREVENT_DAMAGE,
-            params={'all': True, 'battle_only': True}
+            params=_PREVENT_ALL_BATTLE_DAMAGE_PARAMS
         )
 
     @staticmethod
     def prevent_all_damage() -> Effect:
         """Prevent all damage."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.PREVENT_DAMAGE,
-            params={'all': True}
+            params=_ALL_PARAMS
         )
 
     # =========================================================================
@@ -1590,76 +1909,76 @@ class EffectBuilder:
     @staticmethod
     def remove_all_damage() -> Effect:
         """Remove all damage from target (full heal)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_DAMAGE,
-            params={'all': True}
+            params=_ALL_PARAMS
         )
 
     @staticmethod
     def summon() -> Effect:
         """Summon a resonator (put on chase as spell, CR 1006)."""
-        return Effect(action=EffectAction.SUMMON)
+        return Effect._make(action=EffectAction.SUMMON)
 
     @staticmethod
     def copy_spell() -> Effect:
         """Copy target spell or ability (CR 1017.3)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.COPY,
-            params={'type': 'spell'}
+            params=_COPY_SPELL_PARAMS
         )
 
     @staticmethod
     def copy_entity() -> Effect:
         """Copy target entity, creating a token (CR 1017.2)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.COPY,
-            params={'type': 'entity'}
+            params=_COPY_ENTITY_PARAMS
         )
 
     @staticmethod
     def foresee(count: int) -> Effect:
         """Foresee X - look at top X, put any on top/bottom (CR 1034)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.LOOK,
-            params={'count': count, 'foresee': True}
+            params=_frozen_params(('count', count), ('foresee', True))
         )
 
     @staticmethod
     def look(count: int) -> Effect:
         """Look at top N cards of deck (CR 1014)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.LOOK,
-            params={'count': count}
+            params=_frozen_params(('count', count))
         )
 
     @staticmethod
     def set_stats(atk: int, def_: int) -> Effect:
         """Set both ATK and DEF to specific values."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.SET_ATK,
-            params={'atk': atk, 'def': def_}
+            params=_frozen_params(('atk', atk), ('def', def_))
         )
 
     @staticmethod
     def set_race(race: str) -> Effect:
         """Set target's race (replacing existing)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_RACE,
-            params={'race': race, 'replace': True}
+            params=_frozen_params(('race', race), ('replace', True))
         )
 
     @staticmethod
     def call_magic_stone() -> Effect:
         """Call a magic stone (CR 1016)."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.GRANT_ABILITY,
-            params={'call_stone': True}
+            params=_CALL_MAGIC_STONE_PARAMS
         )
 
     @staticmethod
     def remove_keyword(keyword) -> Effect:
         """Remove a keyword ability from target."""
-        return Effect(
+        return Effect._make(
             action=EffectAction.REMOVE_KEYWORD,
-            params={'keyword': keyword}
+            params=_frozen_params(('keyword', keyword))
         )
@@ -11,6 +11,8 @@ Usage:
     # Use like normal GameEngine, but with CR-compliant behavior
 """
 
+from contextlib import contextmanager
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional, List, Dict, Any
 
 if TYPE_CHECKING:
@@ -21,11 +23,54 @@ if TYPE_CHECKING:
 from .priority import PriorityManager, ActionType, PriorityState
 from .costs import CostManager, WillCost, CostPaymentPlan
 from .layers import LayerManager, Layer, LayeredEffect
-from .keywords import KeywordManager, Keyword
+from .keywords import KeywordManager, Keyword, flags_to_mask
 from .replacement import ReplacementManager, ReplacementEventType
 from .triggers import APNAPTriggerManager, TriggerCondition
 from .choices import ChoiceManager, ChoiceType
 from .types import TriggerCondition as TriggerCond, KeywordAbility
+from ..engine import EventType
+from ..models import CardType, Zone
+
+
+# Engine events that can fire APNAP-managed triggers
+_EVENT_TO_TRIGGER = MappingProxyType({
+    EventType.ENTERS_FIELD: TriggerCond.ENTER_FIELD,
+    EventType.LEAVES_FIELD: TriggerCond.LEAVE_FIELD,
+    EventType.CARD_DESTROYED: TriggerCond.DESTROYED,
+    EventType.ATTACK_DECLARED: TriggerCond.DECLARES_ATTACK,
+    EventType.BLOCKER_DECLARED: TriggerCond.DECLARES_BLOCK,
+    EventType.DAMAGE_DEALT: TriggerCond.DEALS_DAMAGE,
+    EventType.TURN_START: TriggerCond.BEGINNING_OF_TURN,
+    EventType.TURN_END: TriggerCond.END_OF_TURN,
+})
+
+# Keyword bit tested directly in the timing check
+_QUICKCAST_BIT = Keyword.QUICKCAST.value
+
+
+class _EmitHook:
+    """
+    Wrapped GameEngine.emit that also checks APNAP-managed triggers.
+
+    Events no trigger is watching return right after the original emit.
+    Only installed while at least one trigger is registered.
+    """
+    __slots__ = ('original_emit', 'rules', 'triggers')
+
+    def __init__(self, original_emit, rules: 'RulesEngine'):
+        self.original_emit = original_emit
+        self.rules = rules
+        self.triggers = rules.triggers
+
+    def __call__(self, event_type, player=-1, card=None, target=None, **data):
+        # Call original emit
+        self.original_emit(event_type, player, card, target, **data)
+
+        # Check for triggered abilities with new system
+        trigger_cond = _EVENT_TO_TRIGGER.get(event_type)
+        if trigger_cond is None or not self.triggers.subscribers(trigger_cond):
+            return
+        self.rules._check_triggers_enhanced(event_type, player, card, target, data)
 
 
 class RulesEngine:
@@ -41,6 +86,11 @@ class RulesEngine:
     - Triggered abilities with APNAP
     - Player choices (targeting, modals, etc.)
     """
+    __slots__ = (
+        'game', 'priority', 'costs', 'layers', 'keywords', 'replacement',
+        'triggers', 'choices', '_sba_dirty', '_batch', '_script_caps',
+        '_original_emit', '_emit_hook',
+    )
 
     def __init__(self, game: 'GameEngine'):
         """
@@ -60,44 +110,66 @@ class RulesEngine:
         self.triggers = APNAPTriggerManager(game)
         self.choices = ChoiceManager(game)
 
+        # Cards whose lethal-damage state may have changed since the last
+        # SBA pass (uid -> card, insertion ordered)
+        self._sba_dirty: Dict[str, 'Card'] = {}
+
+        # (condition, subscribers, event_data) queued by batch_events()
+        self._batch: Optional[List[tuple]] = None
+
+        # card code -> (script, get_target_requirements or None)
+        self._script_caps: Dict[str, tuple] = {}
+
         # Hook into game events
         self._setup_event_hooks()
 
     def _setup_event_hooks(self):
         """Set up event handlers to integrate rules systems."""
-        original_emit = self.game.emit
-
-        def enhanced_emit(event_type, player=-1, card=None, target=None, **data):
-            # Call original emit
-            original_emit(event_type, player, card, target, **data)
+        self.game.subscribe(self._on_game_event)
+
+        # Trigger checks wrap emit, but only while any trigger is registered
+        self._original_emit = self.game.emit
+        self._emit_hook = _EmitHook(self._original_emit, self)
+        self.triggers.on_registry_change = self._refresh_emit
+        self._refresh_emit()
+
+    def _on_game_event(self, event):
+        """Track state changes that SBAs and layers depend on."""
+        # Any game event can change layer inputs (zones, conditions)
+        # and which keywords are on the field
+        self.layers.mark_dirty()
+        self.keywords.invalidate_field_mask()
+        if event.event_type is EventType.DAMAGE_DEALT and event.target is not None:
+            self._sba_dirty[event.target.uid] = event.target
+
+    def _refresh_emit(self):
+        """Swap game.emit between the trigger hook and the original emit."""
+        current = self.game.emit
+        if current is not self._emit_hook and current != self._original_emit:
+            return  # Wrapped again by someone else; leave it alone
+        if self.triggers.triggers:
+            self.game.emit = self._emit_hook
+        else:
+            self.game.emit = self._original_emit
 
-            # Check for triggered abilities with new system
-            self._check_triggers_enhanced(event_type, player, card, target, data)
+    def _check_triggers_enhanced(self, event_type, player, card, target, data):
+        """
+        Check triggers using APNAP-aware trigger manager.
 
-        self.game.emit = enhanced_emit
+        data is the emit's own kwargs dict; it is filled in and handed to
+        the trigger manager as the event data, so callers must not reuse it.
+        """
+        trigger_cond = _EVENT_TO_TRIGGER.get(event_type)
+        if trigger_cond is None:
+            return
 
-    def _check_triggers_enhanced(self, event_type, player, card, target, data):
-        """Check triggers using APNAP-aware trigger manager."""
-        from ..engine import EventType
-
-        # Map EventType to TriggerCondition
-        event_map = {
-            EventType.ENTERS_FIELD: TriggerCond.ENTER_FIELD,
-            EventType.LEAVES_FIELD: TriggerCond.LEAVE_FIELD,
-            EventType.CARD_DESTROYED: TriggerCond.DESTROYED,
-            EventType.ATTACK_DECLARED: TriggerCond.DECLARES_ATTACK,
-            EventType.BLOCKER_DECLARED: TriggerCond.DECLARES_BLOCK,
-            EventType.DAMAGE_DEALT: TriggerCond.DEALS_DAMAGE,
-            EventType.TURN_START: TriggerCond.BEGINNING_OF_TURN,
-            EventType.TURN_END: TriggerCond.END_OF_TURN,
-        }
-
-        trigger_cond = event_map.get(event_type)
-        if not trigger_cond:
+        # Nothing watches this condition: skip building event data
+        subscribers = self.triggers.subscribers(trigger_cond)
+        if not subscribers:
             return
 
-        # Build event data
-        event_data = dict(data)
+        # Build event data in place; the kwargs dict is not used again
+        event_data = data
         if card:
             event_data['source'] = card
             event_data['card'] = card
@@ -105,9 +177,50 @@ class RulesEngine:
             event_data['target'] = target
         event_data['player'] = player
 
+        # Defer to the end of the current batch, if any. The subscribers
+        # are captured now: a card that leaves the field later in the
+        # batch is unregistered, but its own leave triggers must still fire.
+        if self._batch is not None:
+            self._batch.append((trigger_cond, subscribers, event_data))
+            return
+
         # Check triggers
         self.triggers.check_triggers(trigger_cond, event_data)
 
+    @contextmanager
+    def batch_events(self):
+        """
+        Defer trigger checks for events emitted inside the block.
+
+        Queued events are checked in emission order when the outermost
+        batch exits, with runs of the same condition handled by one
+        check_triggers_bulk() call. Each event is checked against the
+        abilities registered when it was emitted. Used for simultaneous
+        events such as state-based destruction (CR 704).
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = []
+        try:
+            yield
+        finally:
+            batch, self._batch = self._batch, None
+            self._flush_batch(batch)
+
+    def _flush_batch(self, batch: List[tuple]):
+        """Check queued events, grouping consecutive same-condition runs."""
+        i = 0
+        while i < len(batch):
+            cond = batch[i][0]
+            j = i + 1
+            while j < len(batch) and batch[j][0] is cond:
+                j += 1
+            self.triggers.check_triggers_bulk(
+                cond, [(subs, data) for _, subs, data in batch[i:j]])
+            i = j
+
     # =========================================================================
     # ENHANCED PRIORITY SYSTEM
     # =========================================================================
@@ -167,6 +280,10 @@ class RulesEngine:
         CR 909: Layer system for continuous effects.
         """
         self.layers.apply_all_effects()
+        # Cards can reach the field without a layer recompute; stamp always
+        lost = self.keywords.refresh_keyword_masks(self.layers._get_all_field_cards())
+        for card in lost:
+            self._sba_dirty[card.uid] = card
 
     def register_continuous_effect(self, effect: LayeredEffect) -> str:
         """Register a new continuous effect."""
@@ -188,13 +305,17 @@ class RulesEngine:
         """
         return self.keywords.card_has_keyword(card, keyword)
 
-    def check_blocking_allowed(self, attacker: 'Card', blocker: 'Card') -> bool:
+    def check_blocking_allowed(self, attacker: 'Card', blocker: 'Card', *,
+                               attacker_kw: Optional[int] = None,
+                               blocker_kw: Optional[int] = None) -> bool:
         """
         Check if blocking is allowed by keywords.
 
         CR 1107: Flying restriction, etc.
         """
-        return self.keywords.check_blocking(attacker, blocker)
+        return self.keywords.check_blocking(attacker, blocker,
+                                            attacker_kw=attacker_kw,
+                                            blocker_kw=blocker_kw)
 
     def check_targeting_allowed(self, source: 'Card', target: 'Card',
                                  source_controller: int) -> bool:
@@ -325,9 +446,10 @@ class RulesEngine:
             return False
 
         # Request targets if needed
-        script = self.game.get_script(card)
-        if script and hasattr(script, 'get_target_requirements'):
-            requirements = script.get_target_requirements(self.game, card)
+        _, get_requirements = (self._script_caps.get(card.data.code)
+                               or self._resolve_script(card))
+        if get_requirements is not None:
+            requirements = get_requirements(self.game, card)
             if requirements:
                 targets = self.request_targets(
                     player, card, requirements,
@@ -351,13 +473,23 @@ class RulesEngine:
         self.game.emit(self.game.EventType.CARD_PLAYED, player, card)
         return True
 
+    def _resolve_script(self, card: 'Card') -> tuple:
+        """Look up a card's script and its target hook, caching hits by code."""
+        script = self.game.get_script(card)
+        if not script:
+            return None, None
+        caps = (script, getattr(script, 'get_target_requirements', None))
+        self._script_caps[card.data.code] = caps
+        return caps
+
     def _can_play_timing(self, player: int, card: 'Card') -> bool:
         """Check if timing allows playing this card."""
-        # Quickcast/instant can be played anytime with priority
-        if self.card_has_keyword(card, Keyword.QUICKCAST):
-            return self.can_act(player)
-
-        if card.data.is_instant():
+        # Quickcast/instant can be played anytime with priority. Printed
+        # Quickcast is part of is_instant(); only a granted one needs the
+        # keyword mask (CR 1112).
+        if card.data.is_instant() or (
+                card.granted_keywords
+                and flags_to_mask(card.granted_keywords) & _QUICKCAST_BIT):
             return self.can_act(player)
 
         # Other cards require main timing
@@ -400,8 +532,7 @@ class RulesEngine:
             return 0
 
         # Apply damage
-        from ..models import Card
-        if isinstance(target, Card):
+        if getattr(target, '_is_card', False):
             target.damage += final_amount
             self.game.emit(
                 self.game.EventType.DAMAGE_DEALT,
@@ -439,30 +570,55 @@ class RulesEngine:
         # Apply continuous effects in layer order
         self.apply_continuous_effects()
 
-        changed = True
+        # First pass scans the whole field (damage and DEF can be changed
+        # directly); later passes only revisit cards queued since then.
+        full_scan = True
+        cards_changed = player_lost = True
         iterations = 0
 
-        while changed and iterations < 100:
-            changed = False
+        while (cards_changed or player_lost) and iterations < 100:
+            cards_changed = player_lost = False
             iterations += 1
 
-            for p_idx, p in enumerate(self.game.players):
-                # Destroy creatures with lethal damage
-                for card in list(p.field):
-                    if card.data.is_resonator() or card.data.card_type.name == 'J_RULER':
-                        if card.damage >= card.effective_def:
-                            # Check for indestructible
-                            if not self.card_has_keyword(card, Keyword.IMPERISHABLE):
-                                if self.destroy_card_enhanced(card, "lethal damage"):
-                                    changed = True
-
-                # Check for player loss
-                if p.life <= 0 and not p.has_lost:
-                    self.game._player_loses(p_idx, "life reached 0")
-                    changed = True
-
-            # Re-apply continuous effects if state changed
-            if changed:
+            queued = list(self._sba_dirty.values())
+            self._sba_dirty.clear()
+
+            # SBAs are performed simultaneously: check triggers together
+            with self.batch_events():
+                for p_idx, p in enumerate(self.game.players):
+                    # Destroy creatures with lethal damage
+                    if full_scan:
+                        field = p.field
+                    else:
+                        field = [
+                            c for c in queued
+                            if c.controller == p_idx and c.zone == Zone.FIELD
+                        ]
+                    dmg_targets = [
+                        c for c in field
+                        if c.data.is_resonator() or c.data.card_type is CardType.J_RULER
+                    ]
+                    # Scan only damage/DEF/keyword bits, then act on the hits
+                    lethal = [
+                        c for c in dmg_targets
+                        if c.damage >= c.effective_def
+                        and not c._imperishable
+                    ]
+                    for card in lethal:
+                        if self.destroy_card_enhanced(card, "lethal damage"):
+                            cards_changed = True
+
+                    # Check for player loss
+                    if p.life <= 0 and not p.has_lost:
+                        self.game._player_loses(p_idx, "life reached 0")
+                        player_lost = True
+
+            full_scan = False
+
+            # Re-apply continuous effects only if cards left the field;
+            # a player losing doesn't change any layer inputs
+            if cards_changed:
+                self.layers.mark_dirty()
                 self.apply_continuous_effects()
 
         # Add pending triggers to chase in APNAP order
@@ -488,6 +644,7 @@ class RulesEngine:
 
         # Reset per-turn trigger state
         self.triggers.reset_turn()
+        self.triggers.clear_order_cache()
 
         # Clear will pools (CR 505.5c)
         for p in self.game.players:
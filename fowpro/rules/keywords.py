@@ -8,20 +8,27 @@ References:
 - CR 1103-1140: Individual keyword definitions
 """
 
+import re
 from dataclasses import dataclass, field
-from enum import Enum, Flag, auto
+from enum import Enum, Flag, IntFlag, auto
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, Optional, Callable, Any, Dict
 
 if TYPE_CHECKING:
     from ..engine import GameEngine
-    from ..models import Card
+    from ..models import Card, CardData
 
+from ..models import CardType, Zone
 
-class Keyword(Flag):
+
+class Keyword(IntFlag):
     """
     All keyword abilities in Force of Will (Grimm Cluster era).
 
     CR 1101: Keyword abilities are abilities represented by a single word.
+
+    An IntFlag so keyword sets can be held as plain ints internally; hot
+    paths test against member .value bits.
     """
     NONE = 0
 
@@ -145,7 +152,71 @@ class Keyword(Flag):
     PROVIDENCE = auto()
 
 
-@dataclass
+# Keyword bits handled by on_deals_damage()
+_PIERCE = Keyword.PIERCE.value
+_DRAIN = Keyword.DRAIN.value
+_EXPLODE = Keyword.EXPLODE.value
+_DAMAGE_KEYWORDS_MASK = _PIERCE | _DRAIN | _EXPLODE
+
+# Field keywords gated by KeywordManager.field_keywords_mask()
+_BARRIER = Keyword.BARRIER.value
+_FLYING = Keyword.FLYING.value
+_STEALTH = Keyword.STEALTH.value
+_TARGET_ATTACK = Keyword.TARGET_ATTACK.value
+_PRECISION = Keyword.PRECISION.value
+_IMPERISHABLE = Keyword.IMPERISHABLE.value
+
+# Handler table slots (bit positions) for trigger/replacement/restriction lookups
+_PIERCE_IDX = _PIERCE.bit_length() - 1
+_DRAIN_IDX = _DRAIN.bit_length() - 1
+_EXPLODE_IDX = _EXPLODE.bit_length() - 1
+_BARRIER_IDX = _BARRIER.bit_length() - 1
+_IMPERISHABLE_IDX = _IMPERISHABLE.bit_length() - 1
+_ETERNAL_IDX = Keyword.ETERNAL.value.bit_length() - 1
+
+
+@lru_cache(maxsize=None)
+def flags_to_mask(flags: Flag) -> int:
+    """
+    Translate a keyword Flag into a Keyword bitmask.
+
+    Cards carry models.Keyword / KeywordAbility flags; members are matched
+    to this enum by name.
+    """
+    mask = 0
+    for member in flags:
+        kw = Keyword.__members__.get(member.name)
+        if kw is not None:
+            mask |= kw.value
+    return mask
+
+
+def printed_keyword_mask(data: 'CardData') -> int:
+    """
+    Get the Keyword bitmask of a card's printed keywords.
+
+    Stored on the CardData (shared by every copy of the card) together
+    with the flags it came from, and rebuilt if keywords is reassigned.
+    """
+    keywords = data.keywords
+    cached = getattr(data, '_keywords_int', None)
+    if cached is not None and cached[0] is keywords:
+        return cached[1]
+
+    mask = flags_to_mask(keywords) if keywords else 0
+    data._keywords_int = (keywords, mask)
+    return mask
+
+
+def keyword_mask(card: 'Card') -> int:
+    """Compute a card's current Keyword bitmask (printed or granted)."""
+    mask = printed_keyword_mask(card.data) if card.data else 0
+    if card.granted_keywords:
+        mask |= flags_to_mask(card.granted_keywords)
+    return mask
+
+
+@dataclass(slots=True)
 class KeywordHandler:
     """
     Handler for a specific keyword's behavior.
@@ -176,202 +247,267 @@ class KeywordHandler:
     restriction_check: Optional[Callable] = None
 
 
+# Standard keyword handlers. They only touch the game passed in, so they
+# are shared by every KeywordManager.
+
+# ==== PIERCE (CR 1103) ====
+def _pierce_damage_handler(game, source, target, damage, is_battle_damage):
+    """Handle pierce excess damage."""
+    if not is_battle_damage:
+        return damage, 0
+
+    if not hasattr(target, 'current_def') or target.current_def is None:
+        return damage, 0
+
+    excess = max(0, damage - target.current_def)
+    if excess > 0:
+        # Deal excess to controller
+        target_controller = target.controller
+        game.players[target_controller].life -= excess
+
+    return damage, excess
+
+
+# ==== PRECISION (CR 1104) ====
+def _precision_attack_check(game, attacker, target):
+    """Allow attacking recovered J/resonators."""
+    return True  # Always allows
+
+
+# ==== FLYING (CR 1107) ====
+def _flying_block_restriction(game, attacker, blocker):
+    """Can only be blocked by flying."""
+    if attacker.has_keyword(Keyword.FLYING):
+        return blocker.has_keyword(Keyword.FLYING)
+    return True
+
+
+# ==== DRAIN (CR 1136) ====
+def _drain_handler(game, source, target, damage):
+    """Gain life equal to damage dealt."""
+    if damage > 0:
+        game.players[source.controller].life += damage
+
+
+# ==== IMPERISHABLE (CR 1109) ====
+def _imperishable_replacement(game, card, event_data):
+    """Prevent J-ruler destruction, lose life instead."""
+    if card.data and card.data.card_type == CardType.J_RULER:
+        damage = card.damage or 0
+        if damage > 0:
+            game.players[card.controller].life -= damage * 100
+        card.damage = 0
+        return True  # Replaced - don't destroy
+    return False  # Not replaced
+
+
+# ==== BARRIER (CR 1120) ====
+def _barrier_targeting_check(game, source, target, source_controller):
+    """Prevent opponent targeting."""
+    if target.has_keyword(Keyword.BARRIER):
+        if source_controller != target.controller:
+            return False
+    return True
+
+
+# ==== STEALTH ====
+def _stealth_block_restriction(game, attacker, blocker):
+    """Can't be blocked."""
+    return not attacker.has_keyword(Keyword.STEALTH)
+
+
+# ==== ETERNAL ====
+def _eternal_replacement(game, card, event_data):
+    """Return to hand instead of graveyard."""
+    target_zone = event_data.get('zone')
+    if target_zone == Zone.GRAVEYARD:
+        # Move to hand instead
+        game.move_card(card, Zone.HAND, card.owner)
+        return True
+    return False
+
+
+# (keyword, KeywordHandler fields), in registration order. Keywords with no
+# fields are handled elsewhere (combat resolution, timing checks, etc).
+_STANDARD_HANDLERS = (
+    (Keyword.PIERCE, dict(trigger_event='deals_battle_damage',
+                          trigger_effect=_pierce_damage_handler)),
+    (Keyword.PRECISION, dict(restriction_check=_precision_attack_check)),
+    # First strike is handled in combat resolution
+    (Keyword.FIRST_STRIKE, {}),
+    (Keyword.FLYING, dict(restriction_check=_flying_block_restriction)),
+    # Handled in ActivateAbility.can_play() - checks entered_turn == turn_number
+    (Keyword.SWIFTNESS, {}),
+    (Keyword.DRAIN, dict(trigger_event='deals_damage',
+                         trigger_effect=_drain_handler)),
+    (Keyword.IMPERISHABLE, dict(replaces_event='destroy',
+                                replacement=_imperishable_replacement)),
+    (Keyword.BARRIER, dict(restriction_check=_barrier_targeting_check)),
+    (Keyword.STEALTH, dict(restriction_check=_stealth_block_restriction)),
+    # Handled in priority/timing checks
+    (Keyword.QUICKCAST, {}),
+    (Keyword.ETERNAL, dict(replaces_event='zone_change',
+                           replacement=_eternal_replacement)),
+    # Handled by allowing play from graveyard
+    (Keyword.REMNANT, {}),
+    # Handled by allowing selection of J/resonators as attack targets
+    (Keyword.TARGET_ATTACK, {}),
+)
+
+
 class KeywordManager:
     """
     Manages keyword ability behavior and effects.
 
     Integrates keywords into the game engine.
     """
+    __slots__ = ('game', 'handlers', '_trigger_effects', '_replacements',
+                 '_restriction_checks', '_damage_mask', '_field_mask',
+                 '_explode_pending')
 
     def __init__(self, game: 'GameEngine'):
         self.game = game
         self.handlers: Dict[Keyword, KeywordHandler] = {}
-        self._register_all_handlers()
 
-    def _register_all_handlers(self):
-        """Register handlers for all keywords."""
+        # Hot handler callables, indexed by keyword bit position
+        self._trigger_effects: List[Optional[Callable]] = [None] * len(Keyword)
+        self._replacements: List[Optional[Callable]] = [None] * len(Keyword)
+        self._restriction_checks: List[Optional[Callable]] = [None] * len(Keyword)
 
-        # ==== PIERCE (CR 1103) ====
-        def pierce_damage_handler(game, source, target, damage, is_battle_damage):
-            """Handle pierce excess damage."""
-            if not is_battle_damage:
-                return damage, 0
+        # Damage keywords that currently have a trigger effect registered
+        self._damage_mask = 0
 
-            if not hasattr(target, 'current_def') or target.current_def is None:
-                return damage, 0
+        # Printed keywords of all field cards; None until next computed
+        self._field_mask: Optional[int] = None
 
-            excess = max(0, damage - target.current_def)
-            if excess > 0:
-                # Deal excess to controller
-                target_controller = target.controller
-                game.players[target_controller].life -= excess
+        # Cards marked by Explode this battle (uid -> card)
+        self._explode_pending: Dict[str, 'Card'] = {}
 
-            return damage, excess
-
-        self.handlers[Keyword.PIERCE] = KeywordHandler(
-            keyword=Keyword.PIERCE,
-            trigger_event='deals_battle_damage',
-            trigger_effect=pierce_damage_handler,
-        )
-
-        # ==== PRECISION (CR 1104) ====
-        def precision_attack_check(game, attacker, target):
-            """Allow attacking recovered J/resonators."""
-            return True  # Always allows
-
-        self.handlers[Keyword.PRECISION] = KeywordHandler(
-            keyword=Keyword.PRECISION,
-            restriction_check=precision_attack_check,
-        )
-
-        # ==== FIRST STRIKE (CR 1105) ====
-        # First strike is handled in combat resolution
-        self.handlers[Keyword.FIRST_STRIKE] = KeywordHandler(
-            keyword=Keyword.FIRST_STRIKE,
-        )
-
-        # ==== FLYING (CR 1107) ====
-        def flying_block_restriction(game, attacker, blocker):
-            """Can only be blocked by flying."""
-            if attacker.has_keyword(Keyword.FLYING):
-                return blocker.has_keyword(Keyword.FLYING)
-            return True
+        self._register_all_handlers()
 
-        self.handlers[Keyword.FLYING] = KeywordHandler(
-            keyword=Keyword.FLYING,
-            restriction_check=flying_block_restriction,
-        )
+    def register_handler(self, handler: KeywordHandler):
+        """Register (or replace) the handler for a single keyword."""
+        self.handlers[handler.keyword] = handler
+        idx = handler.keyword.value.bit_length() - 1
+        self._trigger_effects[idx] = handler.trigger_effect
+        self._replacements[idx] = handler.replacement
+        self._restriction_checks[idx] = handler.restriction_check
+
+        bit = handler.keyword.value
+        if bit & _DAMAGE_KEYWORDS_MASK:
+            if handler.trigger_effect:
+                self._damage_mask |= bit
+            else:
+                self._damage_mask &= ~bit
 
-        # ==== SWIFTNESS (CR 1108) ====
-        # Handled in ActivateAbility.can_play() - checks entered_turn == turn_number
-        self.handlers[Keyword.SWIFTNESS] = KeywordHandler(
-            keyword=Keyword.SWIFTNESS,
-        )
+    def _register_all_handlers(self):
+        """Register handlers for all keywords."""
+        for keyword, fields in _STANDARD_HANDLERS:
+            self.register_handler(KeywordHandler(keyword=keyword, **fields))
 
         # ==== EXPLODE (CR 1106) ====
-        def explode_handler(game, source, target, damage):
-            """Mutual destruction after battle damage."""
-            if damage > 0:
-                # Mark both for destruction after battle
-                source._explode_pending = True
-                target._explode_pending = True
-
-        self.handlers[Keyword.EXPLODE] = KeywordHandler(
+        # Needs this manager's pending set, so it is a bound method
+        self.register_handler(KeywordHandler(
             keyword=Keyword.EXPLODE,
             trigger_event='deals_battle_damage',
-            trigger_effect=explode_handler,
-        )
-
-        # ==== DRAIN (CR 1136) ====
-        def drain_handler(game, source, target, damage):
-            """Gain life equal to damage dealt."""
-            if damage > 0:
-                game.players[source.controller].life += damage
-
-        self.handlers[Keyword.DRAIN] = KeywordHandler(
-            keyword=Keyword.DRAIN,
-            trigger_event='deals_damage',
-            trigger_effect=drain_handler,
-        )
-
-        # ==== IMPERISHABLE (CR 1109) ====
-        def imperishable_replacement(game, card, event_data):
-            """Prevent J-ruler destruction, lose life instead."""
-            from ..models import CardType
-
-            if card.data and card.data.card_type == CardType.J_RULER:
-                damage = card.damage or 0
-                if damage > 0:
-                    game.players[card.controller].life -= damage * 100
-                card.damage = 0
-                return True  # Replaced - don't destroy
-            return False  # Not replaced
-
-        self.handlers[Keyword.IMPERISHABLE] = KeywordHandler(
-            keyword=Keyword.IMPERISHABLE,
-            replaces_event='destroy',
-            replacement=imperishable_replacement,
-        )
-
-        # ==== BARRIER (CR 1120) ====
-        def barrier_targeting_check(game, source, target, source_controller):
-            """Prevent opponent targeting."""
-            if target.has_keyword(Keyword.BARRIER):
-                if source_controller != target.controller:
-                    return False
-            return True
+            trigger_effect=self._explode_handler,
+        ))
 
-        self.handlers[Keyword.BARRIER] = KeywordHandler(
-            keyword=Keyword.BARRIER,
-            restriction_check=barrier_targeting_check,
-        )
-
-        # ==== STEALTH ====
-        def stealth_block_restriction(game, attacker, blocker):
-            """Can't be blocked."""
-            return not attacker.has_keyword(Keyword.STEALTH)
-
-        self.handlers[Keyword.STEALTH] = KeywordHandler(
-            keyword=Keyword.STEALTH,
-            restriction_check=stealth_block_restriction,
-        )
-
-        # ==== QUICKCAST (CR 1112) ====
-        # Handled in priority/timing checks
-        self.handlers[Keyword.QUICKCAST] = KeywordHandler(
-            keyword=Keyword.QUICKCAST,
-        )
-
-        # ==== ETERNAL ====
-        def eternal_replacement(game, card, event_data):
-            """Return to hand instead of graveyard."""
-            from ..models import Zone
-            target_zone = event_data.get('zone')
-            if target_zone == Zone.GRAVEYARD:
-                # Move to hand instead
-                game.move_card(card, Zone.HAND, card.owner)
-                return True
-            return False
+    def _explode_handler(self, game, source, target, damage):
+        """Mutual destruction after battle damage."""
+        if damage > 0:
+            # Mark both for destruction after battle
+            self._explode_pending[source.uid] = source
+            self._explode_pending[target.uid] = target
 
-        self.handlers[Keyword.ETERNAL] = KeywordHandler(
-            keyword=Keyword.ETERNAL,
-            replaces_event='zone_change',
-            replacement=eternal_replacement,
-        )
+    def card_has_keyword(self, card: 'Card', keyword: Keyword) -> bool:
+        """Check if a card has a keyword (printed or granted)."""
+        return bool(self.get_all_keywords_int(card) & keyword.value)
 
-        # ==== REMNANT (CR 1115) ====
-        # Handled by allowing play from graveyard
-        self.handlers[Keyword.REMNANT] = KeywordHandler(
-            keyword=Keyword.REMNANT,
-        )
+    def get_all_keywords(self, card: 'Card') -> Keyword:
+        """Get all keywords a card currently has."""
+        return Keyword(self.get_all_keywords_int(card))
 
-        # ==== TARGET ATTACK ====
-        # Handled by allowing selection of J/resonators as attack targets
-        self.handlers[Keyword.TARGET_ATTACK] = KeywordHandler(
-            keyword=Keyword.TARGET_ATTACK,
-        )
+    def get_all_keywords_int(self, card: 'Card') -> int:
+        """
+        Get a card's keywords as a raw Keyword bitmask.
 
-    def card_has_keyword(self, card: 'Card', keyword: Keyword) -> bool:
-        """Check if a card has a keyword (printed or granted)."""
-        # Check granted keywords
-        if card.granted_keywords & keyword:
-            return True
+        Cached on the card together with the flags it was built from, so
+        it stays valid however granted_keywords or data are reassigned.
+        """
+        granted = card.granted_keywords
+        printed = card.data.keywords if card.data else None
 
-        # Check printed keywords (from card data)
-        if card.data and card.data.keywords:
-            if keyword in card.data.keywords:
-                return True
+        # Most cards have no keywords at all
+        if not granted and not printed:
+            return 0
 
-        return False
+        cache = getattr(card, '_kw_cache', None)
+        if cache is not None and cache[0] is granted and cache[1] is printed:
+            return cache[2]
 
-    def get_all_keywords(self, card: 'Card') -> Keyword:
-        """Get all keywords a card currently has."""
-        keywords = card.granted_keywords
+        mask = keyword_mask(card)
+        card._kw_cache = (granted, printed, mask)
+        return mask
 
-        if card.data and card.data.keywords:
-            keywords |= card.data.keywords
+    def invalidate_field_mask(self):
+        """Forget the cached field keyword mask (on any game event)."""
+        self._field_mask = None
 
-        return keywords
+    def field_keywords_mask(self) -> int:
+        """
+        Get the OR of printed keywords of every card on the field.
+
+        Cached until invalidate_field_mask(); cards only reach the field
+        through moves that emit an event.
+        """
+        mask = self._field_mask
+        if mask is None:
+            mask = 0
+            for p in self.game.players:
+                for card in p.field:
+                    if card.data:
+                        mask |= printed_keyword_mask(card.data)
+            self._field_mask = mask
+        return mask
+
+    def _may_have_keyword(self, card: 'Card', keyword_bits: int) -> bool:
+        """
+        Cheap gate for field keyword checks.
+
+        False only if the card has no granted keywords and no card on the
+        field prints any of keyword_bits, so it can't have them.
+        """
+        return bool(card.granted_keywords
+                    or self.field_keywords_mask() & keyword_bits)
+
+    def refresh_keyword_masks(self, cards: List['Card']) -> List['Card']:
+        """
+        Stamp each card's keyword bitmask for has_kw_fast().
+
+        Called after continuous effects are applied, when granted
+        keywords can have changed. Also publishes card._imperishable
+        for the SBA lethal-damage scan (CR 1109).
+
+        Returns the cards that just lost Imperishable.
+        """
+        imperishable = Keyword.IMPERISHABLE.value
+        lost = []
+        for card in cards:
+            mask = keyword_mask(card)
+            card._kw_mask = mask
+            is_imperishable = bool(mask & imperishable)
+            if not is_imperishable and getattr(card, '_imperishable', False):
+                lost.append(card)
+            card._imperishable = is_imperishable
+        return lost
+
+    def has_kw_fast(self, card: 'Card', keyword: Keyword) -> bool:
+        """Bit test against the mask stamped by refresh_keyword_masks()."""
+        mask = getattr(card, '_kw_mask', None)
+        if mask is None:
+            mask = card._kw_mask = keyword_mask(card)
+        return bool(mask & keyword.value)
 
     def check_targeting(self, source: 'Card', target: 'Card',
                         source_controller: int) -> bool:
@@ -380,56 +516,74 @@ class KeywordManager:
 
         CR 1120: Barrier prevents opponent targeting.
         """
-        handler = self.handlers.get(Keyword.BARRIER)
-        if handler and handler.restriction_check:
-            if self.card_has_keyword(target, Keyword.BARRIER):
-                return handler.restriction_check(
-                    self.game, source, target, source_controller
-                )
+        if not self._may_have_keyword(target, _BARRIER):
+            return True
+
+        if not self.get_all_keywords_int(target) & _BARRIER:
+            return True
+
+        check = self._restriction_checks[_BARRIER_IDX]
+        if check:
+            return check(self.game, source, target, source_controller)
         return True
 
-    def check_blocking(self, attacker: 'Card', blocker: 'Card') -> bool:
+    def check_blocking(self, attacker: 'Card', blocker: 'Card', *,
+                       attacker_kw: Optional[int] = None,
+                       blocker_kw: Optional[int] = None) -> bool:
         """
         Check if blocking is allowed by keywords.
 
         CR 1107: Flying can only be blocked by flying.
+
+        attacker_kw/blocker_kw may pass keyword ints the caller already
+        got from get_all_keywords_int(), e.g. when checking one attacker
+        against every possible blocker.
         """
-        # Check flying
-        if self.card_has_keyword(attacker, Keyword.FLYING):
-            if not self.card_has_keyword(blocker, Keyword.FLYING):
-                return False
+        if attacker_kw is None:
+            if not self._may_have_keyword(attacker, _FLYING | _STEALTH):
+                return True
+            attacker_kw = self.get_all_keywords_int(attacker)
+        kw = attacker_kw
 
         # Check stealth
-        if self.card_has_keyword(attacker, Keyword.STEALTH):
+        if kw & _STEALTH:
             return False
 
+        # Check flying
+        if kw & _FLYING:
+            if blocker_kw is None:
+                blocker_kw = self.get_all_keywords_int(blocker)
+            if not blocker_kw & _FLYING:
+                return False
+
         return True
 
-    def can_attack_target(self, attacker: 'Card', target: 'Card') -> bool:
+    def can_attack_target(self, attacker: 'Card', target: 'Card', *,
+                          attacker_kw: Optional[int] = None) -> bool:
         """
         Check if an attacker can target something.
 
         Target Attack allows attacking J/resonators.
         Precision allows attacking recovered J/resonators.
+        attacker_kw is an optional precomputed get_all_keywords_int().
         """
-        from ..models import CardType
-
         # J-ruler and player can always be attacked
         if not target or not target.data:
             return True
 
-        if target.data.card_type == CardType.J_RULER:
+        # Resonators require Target Attack
+        if target.data.card_type is not CardType.RESONATOR:
             return True
 
-        # Resonators require Target Attack
-        if target.data.card_type == CardType.RESONATOR:
-            if not self.card_has_keyword(attacker, Keyword.TARGET_ATTACK):
-                return False
+        kw = attacker_kw
+        if kw is None:
+            kw = self.get_all_keywords_int(attacker)
+        if not kw & _TARGET_ATTACK:
+            return False
 
-            # Recovered resonators require Precision
-            if not target.is_rested:
-                if not self.card_has_keyword(attacker, Keyword.PRECISION):
-                    return False
+        # Recovered resonators require Precision
+        if not target.is_rested and not kw & _PRECISION:
+            return False
 
         return True
 
@@ -446,25 +600,25 @@ class KeywordManager:
         """Handle damage-related keyword effects."""
         total_damage = damage
 
+        # Only keywords with a registered handler survive the mask
+        kw = self.get_all_keywords_int(source) & self._damage_mask
+        if not kw:
+            return total_damage
+
+        effects = self._trigger_effects
+
         # Pierce
-        if is_battle_damage and self.card_has_keyword(source, Keyword.PIERCE):
-            handler = self.handlers.get(Keyword.PIERCE)
-            if handler and handler.trigger_effect:
-                _, excess = handler.trigger_effect(
-                    self.game, source, target, damage, is_battle_damage
-                )
+        if is_battle_damage and kw & _PIERCE:
+            effects[_PIERCE_IDX](self.game, source, target, damage,
+                                 is_battle_damage)
 
         # Drain
-        if self.card_has_keyword(source, Keyword.DRAIN):
-            handler = self.handlers.get(Keyword.DRAIN)
-            if handler and handler.trigger_effect:
-                handler.trigger_effect(self.game, source, target, damage)
+        if kw & _DRAIN:
+            effects[_DRAIN_IDX](self.game, source, target, damage)
 
         # Explode
-        if is_battle_damage and self.card_has_keyword(source, Keyword.EXPLODE):
-            handler = self.handlers.get(Keyword.EXPLODE)
-            if handler and handler.trigger_effect:
-                handler.trigger_effect(self.game, source, target, damage)
+        if is_battle_damage and kw & _EXPLODE:
+            effects[_EXPLODE_IDX](self.game, source, target, damage)
 
         return total_damage
 
@@ -476,10 +630,13 @@ class KeywordManager:
 
         Returns True if destruction was replaced.
         """
+        if not self._may_have_keyword(card, _IMPERISHABLE):
+            return False
+
         if self.card_has_keyword(card, Keyword.IMPERISHABLE):
-            handler = self.handlers.get(Keyword.IMPERISHABLE)
-            if handler and handler.replacement:
-                return handler.replacement(self.game, card, {})
+            replacement = self._replacements[_IMPERISHABLE_IDX]
+            if replacement:
+                return replacement(self.game, card, {})
         return False
 
     def check_zone_change_replacement(self, card: 'Card', from_zone, to_zone) -> bool:
@@ -490,15 +647,11 @@ class KeywordManager:
 
         Returns True if zone change was replaced.
         """
-        from ..models import Zone
-
         if to_zone == Zone.GRAVEYARD:
             if self.card_has_keyword(card, Keyword.ETERNAL):
-                handler = self.handlers.get(Keyword.ETERNAL)
-                if handler and handler.replacement:
-                    return handler.replacement(
-                        self.game, card, {'zone': to_zone}
-                    )
+                replacement = self._replacements[_ETERNAL_IDX]
+                if replacement:
+                    return replacement(self.game, card, {'zone': to_zone})
         return False
 
     def can_play_from_graveyard(self, card: 'Card') -> bool:
@@ -515,49 +668,70 @@ class KeywordManager:
 
     def process_end_of_battle_keywords(self):
         """Process keywords that trigger at end of battle (Explode)."""
-        for p in self.game.players:
-            for card in list(p.field):
-                if getattr(card, '_explode_pending', False):
-                    card._explode_pending = False
-                    self.game._destroy_card(card)
+        if not self._explode_pending:
+            return
+
+        pending = list(self._explode_pending.values())
+        self._explode_pending.clear()
+        for card in pending:
+            if card.zone == Zone.FIELD:
+                self.game._destroy_card(card)
 
 
 # Utility functions
-def parse_keywords_from_text(text: str) -> Keyword:
-    """Parse keyword abilities from card text."""
-    keywords = Keyword.NONE
 
+# Card text -> keyword bit, matched case-insensitively as whole words
+_KEYWORD_TEXT: Dict[str, int] = {
+    'pierce': Keyword.PIERCE.value,
+    'precision': Keyword.PRECISION.value,
+    'first strike': Keyword.FIRST_STRIKE.value,
+    'flying': Keyword.FLYING.value,
+    'swiftness': Keyword.SWIFTNESS.value,
+    'explode': Keyword.EXPLODE.value,
+    'drain': Keyword.DRAIN.value,
+    'target attack': Keyword.TARGET_ATTACK.value,
+    'imperishable': Keyword.IMPERISHABLE.value,
+    'barrier': Keyword.BARRIER.value,
+    'stealth': Keyword.STEALTH.value,
+    'quickcast': Keyword.QUICKCAST.value,
+    'trigger': Keyword.TRIGGER.value,
+    'awakening': Keyword.AWAKENING.value,
+    'incarnation': Keyword.INCARNATION.value,
+    'remnant': Keyword.REMNANT.value,
+    'eternal': Keyword.ETERNAL.value,
+    'bestow': Keyword.BESTOW.value,
+    'limit break': Keyword.LIMIT_BREAK.value,
+    'providence': Keyword.PROVIDENCE.value,
+}
+
+_KEYWORD_KEYS = frozenset(_KEYWORD_TEXT)
+
+# Brackets are dropped, so '[Quickcast]' tokenizes to 'quickcast'
+_WORD_RE = re.compile(r'[a-z]+')
+
+
+@lru_cache(maxsize=4096)
+def parse_keyword_bits(text: str) -> int:
+    """
+    Parse keyword abilities from card text as a raw Keyword bitmask.
+
+    Matches whole words and two-word phrases only, so e.g. 'piercer'
+    does not count as Pierce. Cached, since reprints and shared reminder
+    text repeat the same strings.
+    """
     if not text:
-        return keywords
-
-    text_lower = text.lower()
-
-    keyword_map = {
-        'pierce': Keyword.PIERCE,
-        'precision': Keyword.PRECISION,
-        'first strike': Keyword.FIRST_STRIKE,
-        'flying': Keyword.FLYING,
-        'swiftness': Keyword.SWIFTNESS,
-        'explode': Keyword.EXPLODE,
-        'drain': Keyword.DRAIN,
-        'target attack': Keyword.TARGET_ATTACK,
-        'imperishable': Keyword.IMPERISHABLE,
-        'barrier': Keyword.BARRIER,
-        'stealth': Keyword.STEALTH,
-        'quickcast': Keyword.QUICKCAST,
-        '[quickcast]': Keyword.QUICKCAST,
-        'trigger': Keyword.TRIGGER,
-        'awakening': Keyword.AWAKENING,
-        'incarnation': Keyword.INCARNATION,
-        'remnant': Keyword.REMNANT,
-        'eternal': Keyword.ETERNAL,
-        'bestow': Keyword.BESTOW,
-        'limit break': Keyword.LIMIT_BREAK,
-        'providence': Keyword.PROVIDENCE,
-    }
-
-    for kw_text, kw_enum in keyword_map.items():
-        if kw_text in text_lower:
-            keywords |= kw_enum
-
-    return keywords
+        return 0
+
+    words = _WORD_RE.findall(text.lower())
+    tokens = set(words)
+    tokens.update(f'{a} {b}' for a, b in zip(words, words[1:]))
+
+    bits = 0
+    for kw_text in tokens & _KEYWORD_KEYS:
+        bits |= _KEYWORD_TEXT[kw_text]
+    return bits
+
+
+def parse_keywords_from_text(text: str) -> Keyword:
+    """Parse keyword abilities from card text (see parse_keyword_bits)."""
+    return Keyword(parse_keyword_bits(text))
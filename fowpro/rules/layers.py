@@ -11,14 +11,18 @@ References:
 - CR 909.3: Dependency handling
 """
 
+import heapq
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import TYPE_CHECKING, List, Optional, Dict, Set, Callable, Any
+from functools import lru_cache
+from typing import (TYPE_CHECKING, AbstractSet, List, Optional, Dict, Sequence,
+                    Callable, Any)
 
 if TYPE_CHECKING:
     from ..engine import GameEngine
     from ..models import Card
 
+from ..models import Zone
 from .types import EffectDuration, KeywordAbility
 from .targeting import TargetFilter
 from .conditions import Condition
@@ -65,7 +69,37 @@ class Layer(IntEnum):
     OTHER = 8
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _parse_stat_counter(counter_type: str) -> Optional[tuple]:
+    """Parse a '+X/+Y' counter name into (atk, def), or None if malformed."""
+    try:
+        parts = counter_type.split('/')
+        atk_mod = int(parts[0])
+        def_mod = int(parts[1]) if len(parts) > 1 else 0
+    except (ValueError, IndexError):
+        return None
+    return atk_mod, def_mod
+
+
+def _sum_stat_counters(counters: Dict[str, int]) -> Optional[tuple]:
+    """
+    Total the ATK/DEF of a card's '+X/+Y' counters (+100/+100 counters, etc).
+
+    Returns None if the card has no such counters.
+    """
+    found = False
+    atk = dfn = 0
+    for counter_type, count in counters.items():
+        if counter_type.startswith('+'):
+            mods = _parse_stat_counter(counter_type)
+            if mods:
+                atk += mods[0] * count
+                dfn += mods[1] * count
+                found = True
+    return (atk, dfn) if found else None
+
+
+@dataclass(slots=True)
 class LayeredEffect:
     """
     A continuous effect that applies in the layer system.
@@ -98,18 +132,18 @@ class LayeredEffect:
     new_controller: Optional[int] = None
 
     # Layer 4 (Type): types to add/set
-    add_types: List[str] = field(default_factory=list)
+    add_types: Sequence[str] = ()
     set_type: Optional[str] = None
 
     # Layer 5 (Attribute): attributes to add/set
-    add_attributes: List[str] = field(default_factory=list)
+    add_attributes: Sequence[str] = ()
     set_attribute: Optional[str] = None
 
     # Layer 6 (Ability): keywords/abilities to add/remove
     grant_keywords: KeywordAbility = KeywordAbility.NONE
     remove_keywords: KeywordAbility = KeywordAbility.NONE
-    grant_abilities: List[str] = field(default_factory=list)
-    remove_abilities: List[str] = field(default_factory=list)
+    grant_abilities: Sequence[str] = ()
+    remove_abilities: Sequence[str] = ()
 
     # Layer 7 (Stats): ATK/DEF modifications
     set_atk: Optional[int] = None
@@ -130,21 +164,53 @@ class LayeredEffect:
     apply_func: Optional[Callable] = None
 
     # Dependencies (effect IDs that must be applied before this)
-    dependencies: Set[str] = field(default_factory=set)
+    dependencies: AbstractSet[str] = frozenset()
 
-    def applies_to(self, card: 'Card', game: 'GameEngine') -> bool:
-        """Check if this effect applies to a given card."""
-        # Check if source still exists
-        source = game.get_card(self.source_id)
+    # layer as a plain int, for sort keys
+    layer_value: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.layer_value = self.layer.value
+
+    def applies_to(self, card: 'Card', game: 'GameEngine',
+                   sources: Optional[Dict[str, 'Card']] = None) -> bool:
+        """
+        Check if this effect applies to a given card.
+
+        sources optionally maps source IDs to cards already looked up
+        (see LayerManager._resolve_sources).
+        """
+        source = self.live_source(game, sources)
         if not source:
             return False
+        return self.applies_to_from(card, source)
+
+    def live_source(self, game: 'GameEngine',
+                    sources: Optional[Dict[str, 'Card']] = None) -> Optional['Card']:
+        """
+        Get the source card if this effect can currently apply from it.
+
+        None if the source is gone, or is a while-on-field source that
+        has left the field. The same for every card, so apply passes
+        check it once per effect.
+        """
+        # Check if source still exists
+        if sources is not None:
+            source = sources.get(self.source_id)
+        else:
+            source = game.get_card(self.source_id)
+        if not source:
+            return None
 
         # Check duration
         if self.duration == EffectDuration.WHILE_ON_FIELD:
-            from ..models import Zone
             if source.zone != Zone.FIELD:
-                return False
+                return None
 
+        return source
+
+    def applies_to_from(self, card: 'Card', source: 'Card') -> bool:
+        """applies_to() for a source already checked by live_source()."""
         # Self-only check
         if self.affects_self_only:
             return card.uid == self.source_id
@@ -157,19 +223,25 @@ class LayeredEffect:
 
         return True
 
-    def is_active(self, game: 'GameEngine') -> bool:
+    def is_active(self, game: 'GameEngine',
+                  sources: Optional[Dict[str, 'Card']] = None) -> bool:
         """Check if this effect is currently active."""
-        source = game.get_card(self.source_id)
+        if sources is not None:
+            source = sources.get(self.source_id)
+        else:
+            source = game.get_card(self.source_id)
         if not source:
             return False
+        return self.is_active_from(game, source)
 
+    def is_active_from(self, game: 'GameEngine', source: 'Card') -> bool:
+        """is_active() for a source card that was already looked up."""
         # Check condition
         if self.condition:
             return self.condition.check(game, source, source.controller)
 
         # Check duration
         if self.duration == EffectDuration.WHILE_ON_FIELD:
-            from ..models import Zone
             return source.zone == Zone.FIELD
 
         return True
@@ -183,6 +255,8 @@ class LayerManager:
     CR 909.2: Within a layer, effects are applied in timestamp order.
     CR 909.3: Dependency handling.
     """
+    __slots__ = ('game', 'effects', '_by_source', '_effect_counter',
+                 '_timestamp', '_dirty', '_order_cache')
 
     def __init__(self, game: 'GameEngine'):
         self.game = game
@@ -190,12 +264,27 @@ class LayerManager:
         # All registered effects
         self.effects: Dict[str, LayeredEffect] = {}
 
+        # The same effects grouped by source card UID
+        self._by_source: Dict[str, List[LayeredEffect]] = {}
+
         # Effect counter for unique IDs
         self._effect_counter = 0
 
         # Current timestamp
         self._timestamp = 0
 
+        # Set when effects or game state change; apply_all_effects() is a
+        # no-op while clean
+        self._dirty = True
+
+        # (active effect IDs, their application order) from the last
+        # get_effects_in_order(); dropped whenever effects are added/removed
+        self._order_cache: Optional[tuple] = None
+
+    def mark_dirty(self):
+        """Force the next apply_all_effects() to recompute."""
+        self._dirty = True
+
     def register_effect(self, effect: LayeredEffect) -> str:
         """
         Register a new continuous effect.
@@ -208,23 +297,34 @@ class LayerManager:
 
         self._timestamp += 1
         effect.timestamp = self._timestamp
+        effect.layer_value = effect.layer.value
 
         self.effects[effect_id] = effect
+        self._by_source.setdefault(effect.source_id, []).append(effect)
+        self._dirty = True
+        self._order_cache = None
         return effect_id
 
     def unregister_effect(self, effect_id: str):
         """Remove a continuous effect."""
-        if effect_id in self.effects:
-            del self.effects[effect_id]
+        effect = self.effects.pop(effect_id, None)
+        if effect is not None:
+            group = self._by_source.get(effect.source_id)
+            if group is not None:
+                group.remove(effect)
+                if not group:
+                    del self._by_source[effect.source_id]
+            self._dirty = True
+            self._order_cache = None
 
     def unregister_effects_from_source(self, source_id: str):
         """Remove all effects from a specific source."""
-        to_remove = [
-            eid for eid, e in self.effects.items()
-            if e.source_id == source_id
-        ]
-        for eid in to_remove:
-            del self.effects[eid]
+        to_remove = self._by_source.pop(source_id, None)
+        if to_remove:
+            for e in to_remove:
+                del self.effects[e.effect_id]
+            self._dirty = True
+            self._order_cache = None
 
     def remove_duration_effects(self, duration: EffectDuration):
         """Remove all effects with a specific duration."""
@@ -233,27 +333,58 @@ class LayerManager:
             if e.duration == duration
         ]
         for eid in to_remove:
-            del self.effects[eid]
+            self.unregister_effect(eid)
 
     def clear_end_of_turn_effects(self):
         """Remove all until-end-of-turn effects."""
         self.remove_duration_effects(EffectDuration.UNTIL_END_OF_TURN)
 
-    def get_effects_in_order(self) -> List[LayeredEffect]:
+    def _resolve_sources(self) -> Dict[str, 'Card']:
+        """Look up every effect's source card once for a whole pass."""
+        get_card = self.game.get_card
+        return {source_id: get_card(source_id) for source_id in self._by_source}
+
+    def get_effects_in_order(self, sources: Optional[Dict[str, 'Card']] = None
+                             ) -> List[LayeredEffect]:
         """
         Get all active effects in application order.
 
         CR 909.1: Layer order
         CR 909.2: Timestamp order within layers
         CR 909.3: Dependency sorting
+
+        The order only depends on which effects are active, so it is
+        reused while the same set of effects stays active.
         """
-        active = [e for e in self.effects.values() if e.is_active(self.game)]
+        # Look up each source once for all of its effects
+        game = self.game
+        active = []
+        for source_id, group in self._by_source.items():
+            if sources is not None:
+                source = sources.get(source_id)
+            else:
+                source = game.get_card(source_id)
+            if not source:
+                continue
+            for e in group:
+                if e.is_active_from(game, source):
+                    active.append(e)
+        active_ids = tuple(e.effect_id for e in active)
+
+        cache = self._order_cache
+        if cache is not None and cache[0] == active_ids:
+            return list(cache[1])
 
         # Sort by layer, then timestamp
-        active.sort(key=lambda e: (e.layer.value, e.timestamp))
+        active.sort(key=lambda e: (e.layer_value, e.timestamp))
 
-        # Handle dependencies
-        return self._topological_sort(active)
+        # Handle dependencies (most effects declare none)
+        if any(e.dependencies for e in active):
+            ordered = self._topological_sort(active)
+        else:
+            ordered = active
+        self._order_cache = (active_ids, ordered)
+        return list(ordered)
 
     def _topological_sort(self, effects: List[LayeredEffect]) -> List[LayeredEffect]:
         """
@@ -264,55 +395,100 @@ class LayerManager:
         - One could change whether the other applies
         - They're in the same layer
         """
-        # Build dependency graph
-        effect_map = {e.effect_id: e for e in effects}
-        in_degree = {e.effect_id: 0 for e in effects}
-        dependents = {e.effect_id: [] for e in effects}
+        # Build dependency graph over positions in effects
+        index_of = {e.effect_id: i for i, e in enumerate(effects)}
+        in_degree = [0] * len(effects)
+        dependents: List[List[int]] = [[] for _ in effects]
 
-        for e in effects:
+        for i, e in enumerate(effects):
             for dep_id in e.dependencies:
-                if dep_id in effect_map:
-                    in_degree[e.effect_id] += 1
-                    dependents[dep_id].append(e.effect_id)
+                dep_i = index_of.get(dep_id)
+                if dep_i is not None:
+                    in_degree[i] += 1
+                    dependents[dep_i].append(i)
 
-        # Kahn's algorithm
+        # Kahn's algorithm, taking ready effects by layer then timestamp
+        # for deterministic order
         result = []
-        queue = [eid for eid, deg in in_degree.items() if deg == 0]
-
-        while queue:
-            # Sort queue by layer then timestamp for deterministic order
-            queue.sort(key=lambda eid: (
-                effect_map[eid].layer.value,
-                effect_map[eid].timestamp
-            ))
+        heap = [
+            (e.layer_value, e.timestamp, i)
+            for i, e in enumerate(effects) if in_degree[i] == 0
+        ]
+        heapq.heapify(heap)
 
-            eid = queue.pop(0)
-            result.append(effect_map[eid])
+        while heap:
+            _, _, i = heapq.heappop(heap)
+            result.append(effects[i])
 
-            for dep_eid in dependents[eid]:
-                in_degree[dep_eid] -= 1
-                if in_degree[dep_eid] == 0:
-                    queue.append(dep_eid)
+            for dep_i in dependents[i]:
+                in_degree[dep_i] -= 1
+                if in_degree[dep_i] == 0:
+                    dep = effects[dep_i]
+                    heapq.heappush(heap, (dep.layer_value, dep.timestamp, dep_i))
 
         return result
 
-    def apply_all_effects(self):
+    def apply_all_effects(self) -> bool:
         """
         Apply all continuous effects to all cards.
 
-        This recalculates derived stats and abilities.
+        This recalculates derived stats and abilities. Returns False
+        without doing anything if nothing changed since the last pass.
         """
-        # Reset all cards to base values first
-        for card in self._get_all_field_cards():
-            self._reset_card_to_base(card)
+        if not self._dirty:
+            return False
+        self._dirty = False
+
+        # Reset all cards to base values first, collecting them as we go
+        cards = []
+        reset = self._reset_card_to_base
+        for p in self.game.players:
+            for card in p.field:
+                reset(card)
+                cards.append(card)
+        cards_by_race = None  # built on first race-filtered effect
 
         # Apply effects in order
-        effects = self.get_effects_in_order()
+        sources = self._resolve_sources()
+        effects = self.get_effects_in_order(sources)
+        game = self.game
 
         for effect in effects:
-            for card in self._get_all_field_cards():
-                if effect.applies_to(card, self.game):
-                    self._apply_effect_to_card(effect, card)
+            source = effect.live_source(game, sources)
+            if source is None:
+                continue
+
+            candidates = cards
+            if effect.affected_filter and effect.affected_filter.races \
+                    and not effect.affects_self_only:
+                if cards_by_race is None:
+                    cards_by_race = self._index_cards_by_race(cards)
+                candidates = effect.affected_filter.narrow(cards, cards_by_race)
+
+            # Resolve the layer function once for all cards; most effects
+            # have no apply_func, so they skip _apply_effect_to_card()
+            apply = self._LAYER_APPLY.get(effect.layer)
+
+            # Unfiltered effects apply to every field card
+            if effect.affects_self_only or effect.affected_filter:
+                targets = (c for c in candidates
+                           if effect.applies_to_from(c, source))
+            else:
+                targets = candidates
+
+            if effect.apply_func:
+                for card in targets:
+                    self._apply_effect_to_card(effect, card, apply)
+            elif apply:
+                for card in targets:
+                    apply(self, effect, card)
+
+            # Control changes reorder the field lists
+            if effect.layer == Layer.CONTROL:
+                cards = self._get_all_field_cards()
+                cards_by_race = None
+
+        return True
 
     def _get_all_field_cards(self) -> List['Card']:
         """Get all cards on the field."""
@@ -321,109 +497,139 @@ class LayerManager:
             cards.extend(p.field)
         return cards
 
+    @staticmethod
+    def _index_cards_by_race(cards: List['Card']) -> Dict[str, List['Card']]:
+        """Group cards by lowercased race, as TargetFilter matches races."""
+        by_race: Dict[str, List['Card']] = {}
+        for card in cards:
+            if card.data and card.data.races:
+                for race in {r.strip().lower() for r in card.data.races}:
+                    by_race.setdefault(race, []).append(card)
+        return by_race
+
     def _reset_card_to_base(self, card: 'Card'):
         """Reset a card's derived values to base."""
-        if card.data:
-            card.current_atk = card.data.atk
-            card.current_def = card.data.defense
+        data = card.data
+        if data:
+            card.current_atk = data.atk
+            card.current_def = data.defense
         else:
             card.current_atk = 0
             card.current_def = 0
 
         card.granted_keywords = KeywordAbility.NONE
         card.granted_abilities = []
+        card.additional_types = []
+        card.additional_attributes = []
+
+    def _apply_effect_to_card(self, effect: LayeredEffect, card: 'Card',
+                              apply: Optional[Callable] = None):
+        """
+        Apply a single effect to a card.
 
-    def _apply_effect_to_card(self, effect: LayeredEffect, card: 'Card'):
-        """Apply a single effect to a card."""
-        layer = effect.layer
+        apply is the effect's _LAYER_APPLY entry if the caller already
+        looked it up.
+        """
+        if apply is None:
+            apply = self._LAYER_APPLY.get(effect.layer)
+        if apply:
+            apply(self, effect, card)
 
-        # Layer 1: Copy
-        if layer == Layer.COPY and effect.copy_source:
+        # Custom application function
+        if effect.apply_func:
+            effect.apply_func(card, self.game, effect)
+
+    def _apply_copy(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 1: copy effects (CR 909.1a)."""
+        if effect.copy_source:
             source_card = self.game.get_card(effect.copy_source)
             if source_card and source_card.data:
                 # Copy characteristics
                 card.copied_from = source_card.data
 
-        # Layer 2: Control
-        elif layer == Layer.CONTROL and effect.new_controller is not None:
-            old_controller = card.controller
-            new_controller = effect.new_controller
-
-            if old_controller != new_controller:
-                # Move between players
-                if card in self.game.players[old_controller].field:
-                    self.game.players[old_controller].field.remove(card)
-                self.game.players[new_controller].field.append(card)
-                card.controller = new_controller
-
-        # Layer 4: Type
-        elif layer == Layer.TYPE:
-            if effect.set_type:
-                card.current_type = effect.set_type
-            for t in effect.add_types:
-                if not hasattr(card, 'additional_types'):
-                    card.additional_types = []
-                card.additional_types.append(t)
-
-        # Layer 5: Attribute
-        elif layer == Layer.ATTRIBUTE:
-            if effect.set_attribute:
-                card.current_attribute = effect.set_attribute
-            for a in effect.add_attributes:
-                if not hasattr(card, 'additional_attributes'):
-                    card.additional_attributes = []
-                card.additional_attributes.append(a)
-
-        # Layer 6: Abilities
-        elif layer == Layer.ABILITY:
-            if effect.grant_keywords:
-                card.granted_keywords |= effect.grant_keywords
-            if effect.remove_keywords:
-                card.granted_keywords &= ~effect.remove_keywords
-            for ability in effect.grant_abilities:
-                if ability not in card.granted_abilities:
-                    card.granted_abilities.append(ability)
-            for ability in effect.remove_abilities:
-                if ability in card.granted_abilities:
-                    card.granted_abilities.remove(ability)
-
-        # Layer 7a: CDA stats
-        elif layer == Layer.STAT_CDA:
-            # Characteristic-defining abilities set base stats
-            pass  # Handled by card data
-
-        # Layer 7b: Set stats
-        elif layer == Layer.STAT_SET:
-            if effect.set_atk is not None:
-                card.current_atk = effect.set_atk
-            if effect.set_def is not None:
-                card.current_def = effect.set_def
-
-        # Layer 7c: Modify stats
-        elif layer == Layer.STAT_MODIFY:
-            if effect.modify_atk:
-                card.current_atk = (card.current_atk or 0) + effect.modify_atk
-            if effect.modify_def:
-                card.current_def = (card.current_def or 0) + effect.modify_def
-
-        # Layer 7d: Counter-based stats
-        elif layer == Layer.STAT_COUNTER:
-            # +100/+100 counters, etc.
-            for counter_type, count in card.counters.items():
-                if counter_type.startswith('+'):
-                    # Parse +X/+Y format
-                    try:
-                        parts = counter_type.split('/')
-                        atk_mod = int(parts[0])
-                        def_mod = int(parts[1]) if len(parts) > 1 else 0
-                        card.current_atk = (card.current_atk or 0) + (atk_mod * count)
-                        card.current_def = (card.current_def or 0) + (def_mod * count)
-                    except (ValueError, IndexError):
-                        pass
-
-        # Custom application function
-        if effect.apply_func:
-            effect.apply_func(card, self.game, effect)
+    def _apply_control(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 2: control-changing effects (CR 909.1b)."""
+        if effect.new_controller is None:
+            return
+
+        old_controller = card.controller
+        new_controller = effect.new_controller
+
+        if old_controller != new_controller:
+            # Move between players. Find the card by identity: Card is a
+            # dataclass, so `in`/remove() would compare every field of
+            # every other card.
+            old_field = self.game.players[old_controller].field
+            for i, c in enumerate(old_field):
+                if c is card:
+                    del old_field[i]
+                    break
+            self.game.players[new_controller].field.append(card)
+            card.controller = new_controller
+
+    def _apply_type(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 4: type-changing effects (CR 909.1d)."""
+        if effect.set_type:
+            card.current_type = effect.set_type
+        if effect.add_types:
+            card.additional_types.extend(effect.add_types)
+
+    def _apply_attribute(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 5: attribute-changing effects (CR 909.1e)."""
+        if effect.set_attribute:
+            card.current_attribute = effect.set_attribute
+        if effect.add_attributes:
+            card.additional_attributes.extend(effect.add_attributes)
+
+    def _apply_ability(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 6: ability-adding/removing effects (CR 909.1f)."""
+        # Combine as raw ints so only one flag is built per application
+        grant = effect.grant_keywords.value
+        remove = effect.remove_keywords.value
+        if grant or remove:
+            card.granted_keywords = KeywordAbility(
+                (card.granted_keywords.value | grant) & ~remove
+            )
+        for ability in effect.grant_abilities:
+            if ability not in card.granted_abilities:
+                card.granted_abilities.append(ability)
+        for ability in effect.remove_abilities:
+            if ability in card.granted_abilities:
+                card.granted_abilities.remove(ability)
+
+    def _apply_stat_set(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 7b: ATK/DEF setting effects."""
+        if effect.set_atk is not None:
+            card.current_atk = effect.set_atk
+        if effect.set_def is not None:
+            card.current_def = effect.set_def
+
+    def _apply_stat_modify(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 7c: ATK/DEF modifying effects."""
+        if effect.modify_atk:
+            card.current_atk = (card.current_atk or 0) + effect.modify_atk
+        if effect.modify_def:
+            card.current_def = (card.current_def or 0) + effect.modify_def
+
+    def _apply_stat_counter(self, effect: LayeredEffect, card: 'Card'):
+        """Layer 7d: counter-based ATK/DEF."""
+        totals = _sum_stat_counters(card.counters)
+        if totals:
+            card.current_atk = (card.current_atk or 0) + totals[0]
+            card.current_def = (card.current_def or 0) + totals[1]
+
+    # Per-layer application. Layer 7a (CDA) is handled by card data;
+    # text (3) and other (8) effects only use apply_func.
+    _LAYER_APPLY = {
+        Layer.COPY: _apply_copy,
+        Layer.CONTROL: _apply_control,
+        Layer.TYPE: _apply_type,
+        Layer.ATTRIBUTE: _apply_attribute,
+        Layer.ABILITY: _apply_ability,
+        Layer.STAT_SET: _apply_stat_set,
+        Layer.STAT_MODIFY: _apply_stat_modify,
+        Layer.STAT_COUNTER: _apply_stat_counter,
+    }
 
 
 # Convenience functions for creating common effects
@@ -9,14 +9,14 @@ References:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable, TYPE_CHECKING
+from typing import FrozenSet, List, Optional, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..engine import GameEngine
     from ..models import Card
 
 
-@dataclass
+@dataclass(slots=True)
 class Mode:
     """
     A single mode option in a modal effect.
@@ -49,7 +49,7 @@ class Mode:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class ModalChoice:
     """
     A modal choice structure for effects with multiple options.
@@ -76,6 +76,14 @@ class ModalChoice:
         """Get all modes that can be chosen."""
         return [m for m in self.modes if m.can_choose(game, card, player)]
 
+    def get_available_indices(self, game: 'GameEngine', card: 'Card',
+                              player: int) -> FrozenSet[int]:
+        """Get the indices of all modes that can be chosen."""
+        return frozenset(
+            i for i, m in enumerate(self.modes)
+            if m.can_choose(game, card, player)
+        )
+
     def validate_choices(self, chosen_indices: List[int], game: 'GameEngine',
                          card: 'Card', player: int) -> bool:
         """
@@ -91,18 +99,17 @@ class ModalChoice:
             if len(chosen_indices) != self.choose_count:
                 return False
 
-        # Check for duplicates if not allowed
-        if not self.allow_same:
-            if len(chosen_indices) != len(set(chosen_indices)):
-                return False
-
-        # Check each mode is valid
-        available = self.get_available_modes(game, card, player)
-        available_indices = [self.modes.index(m) for m in available]
-
+        # Check each mode is valid, and for duplicates if not allowed
+        available_indices = self.get_available_indices(game, card, player)
+        seen = 0
         for idx in chosen_indices:
             if idx not in available_indices:
                 return False
+            if not self.allow_same:
+                bit = 1 << idx
+                if seen & bit:
+                    return False
+                seen |= bit
 
         return True
 
@@ -15,72 +15,124 @@ This module implements the complete priority system including:
 - Chase resolution triggers
 """
 
+import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import TYPE_CHECKING, Optional, List, Callable, Any
+from functools import lru_cache
+from enum import IntEnum
+from typing import TYPE_CHECKING, Optional, List, Dict, Deque, Tuple, Callable, Any
 
 if TYPE_CHECKING:
     from ..engine import GameEngine
     from ..models import Card
 
+from ..engine import EventType
+from ..models import CardType, ChaseItem, Keyword, Phase, Zone
 
-class PriorityState(Enum):
+
+class PriorityState(IntEnum):
     """
     Current state of the priority system.
 
     CR 604: A player with priority can perform actions.
     """
     # Player has priority and can act
-    ACTIVE = "active"
+    ACTIVE = 0
 
     # Player has passed priority
-    PASSED = "passed"
+    PASSED = 1
 
     # Waiting for opponent response
-    WAITING_RESPONSE = "waiting_response"
+    WAITING_RESPONSE = 2
 
     # Both players passed - resolve chase or advance phase
-    BOTH_PASSED = "both_passed"
+    BOTH_PASSED = 3
 
     # Resolving chase item
-    RESOLVING = "resolving"
+    RESOLVING = 4
 
     # Waiting for player input (targeting, modal choice, etc.)
-    WAITING_INPUT = "waiting_input"
+    WAITING_INPUT = 5
 
 
-class ActionType(Enum):
+class ActionType(IntEnum):
     """
     Types of actions a player can take with priority.
 
     CR 604.1: Actions available with priority.
     """
     # Play a card (spell, resonator, addition)
-    PLAY_CARD = "play_card"
+    PLAY_CARD = 0
 
     # Play an activated ability
-    ACTIVATE_ABILITY = "activate_ability"
+    ACTIVATE_ABILITY = 1
 
     # Play a will ability (doesn't use chase)
-    PRODUCE_WILL = "produce_will"
+    PRODUCE_WILL = 2
 
     # Call a magic stone (main timing only)
-    CALL_STONE = "call_stone"
+    CALL_STONE = 3
 
     # Perform Judgment (main timing only)
-    JUDGMENT = "judgment"
+    JUDGMENT = 4
 
     # Declare attack (battle phase only)
-    ATTACK = "attack"
+    ATTACK = 5
 
     # Declare block (battle phase only)
-    BLOCK = "block"
+    BLOCK = 6
 
     # Pass priority
-    PASS = "pass"
+    PASS = 7
+
+
+def _noop(*args, **kwargs):
+    """Default for unset PriorityManager callbacks."""
+
+
+# Bound once so has_priority() is an identity test on a module global
+_STATE_ACTIVE = PriorityState.ACTIVE
+
+# player -> opponent (priority is strictly two-player)
+_OPPONENT = (1, 0)
+
+# Most recent (player, action) entries kept in action_history
+_HISTORY_LEN = 128
+
+_INSTANT_ACTIONS = (
+    ActionType.PASS, ActionType.PRODUCE_WILL,
+    ActionType.PLAY_CARD, ActionType.ACTIVATE_ABILITY,
+)
+
+
+@dataclass(slots=True)
+class ActionContext:
+    """
+    Timing state for one action, computed once in take_action.
+
+    Handlers read timing from here instead of re-deriving it.
+    """
+    player: int
+    has_priority: bool
+    is_main_timing: bool
+    in_battle: bool
+
+
+@lru_cache(maxsize=None)
+def _data_is_instant_speed(card_type: CardType, ability_text: Optional[str]) -> bool:
+    """Whether printed card data alone allows instant-speed play."""
+    if card_type == CardType.SPELL_CHANT_INSTANT:
+        return True
+    return bool(ability_text) and 'quickcast' in ability_text.lower()
+
 
+# PendingAction.needs_bits flags
+NEEDS_TARGETS = 1
+NEEDS_MODES = 2
+NEEDS_WILL_CHOICE = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class PendingAction:
     """
     An action waiting for additional input (targets, modes, etc.)
@@ -91,10 +143,8 @@ class PendingAction:
     source: Optional['Card'] = None
     player: int = 0
 
-    # What input is needed
-    needs_targets: bool = False
-    needs_modes: bool = False
-    needs_will_choice: bool = False
+    # What input is needed (NEEDS_* bits)
+    needs_bits: int = 0
 
     # Target requirements
     target_requirements: List[Any] = field(default_factory=list)
@@ -108,12 +158,25 @@ class PendingAction:
     will_colors: List[Any] = field(default_factory=list)
     selected_color: Optional[Any] = None
 
-    # Ability index for activated abilities
+    # Activated ability (resolved when the action started) and its index
+    ability: Optional[Any] = None
     ability_index: int = 0
 
     # Callback when action is complete
     on_complete: Optional[Callable] = None
 
+    @property
+    def needs_targets(self) -> bool:
+        return bool(self.needs_bits & NEEDS_TARGETS)
+
+    @property
+    def needs_modes(self) -> bool:
+        return bool(self.needs_bits & NEEDS_MODES)
+
+    @property
+    def needs_will_choice(self) -> bool:
+        return bool(self.needs_bits & NEEDS_WILL_CHOICE)
+
 
 class PriorityManager:
     """
@@ -125,34 +188,70 @@ class PriorityManager:
     CR 605: Priority Sequence - describes how priority passes.
     """
 
+    __slots__ = (
+        'game', 'state', 'active_player', 'turn_player', '_passed_bits',
+        'pending_action', 'action_history',
+        '_on_priority_change', '_on_input_needed', '_on_both_passed',
+        '_action_dispatch',
+    )
+
+    # (main_timing, can_block) -> legal action types with priority.
+    # Passing, will and instant-speed plays are always available; main
+    # timing excludes battle, so (True, True) cannot occur.
+    _LEGAL_TABLE: Dict[Tuple[bool, bool], Tuple[ActionType, ...]] = {
+        (False, False): _INSTANT_ACTIONS,
+        (True, False): _INSTANT_ACTIONS + (
+            ActionType.CALL_STONE, ActionType.JUDGMENT, ActionType.ATTACK),
+        (False, True): _INSTANT_ACTIONS + (ActionType.BLOCK,),
+    }
+
+    # The same table as bitmasks (bit N set for ActionType N), so a
+    # legality check is a shift and an AND
+    _LEGAL_MASKS: Dict[Tuple[bool, bool], int] = {
+        key: sum(1 << action for action in actions)
+        for key, actions in _LEGAL_TABLE.items()
+    }
+
     def __init__(self, game: 'GameEngine'):
         self.game = game
         self.state = PriorityState.ACTIVE
         self.active_player = 0  # Who has priority
         self.turn_player = 0  # Whose turn it is
 
-        # Pass tracking
-        self.player_passed = [False, False]
+        # Pass tracking: bit N set when player N has passed
+        self._passed_bits = 0
 
         # Pending action awaiting input
         self.pending_action: Optional[PendingAction] = None
 
         # Action history for the current priority sequence
-        self.action_history: List[tuple] = []
-
-        # Callbacks
-        self._on_priority_change: Optional[Callable] = None
-        self._on_input_needed: Optional[Callable] = None
-        self._on_both_passed: Optional[Callable] = None
+        self.action_history: Deque[tuple] = deque(maxlen=_HISTORY_LEN)
+
+        # Callbacks (_noop when unset, so notifying never branches)
+        self._on_priority_change: Callable = _noop
+        self._on_input_needed: Callable = _noop
+        self._on_both_passed: Callable = _noop
+
+        # ActionType -> handler(ctx, source=None, **kwargs)
+        self._action_dispatch: Dict[ActionType, Callable[..., bool]] = {
+            ActionType.PASS: self._handle_pass,
+            ActionType.PRODUCE_WILL: self._handle_produce_will,
+            ActionType.PLAY_CARD: self._handle_play_card,
+            ActionType.ACTIVATE_ABILITY: self._handle_activate_ability,
+            ActionType.CALL_STONE: self._handle_call_stone,
+            ActionType.JUDGMENT: self._handle_judgment,
+            ActionType.ATTACK: self._handle_attack,
+            ActionType.BLOCK: self._handle_block,
+        }
 
     def set_callbacks(self,
                       on_priority_change: Callable = None,
                       on_input_needed: Callable = None,
                       on_both_passed: Callable = None):
         """Set callback functions for priority events."""
-        self._on_priority_change = on_priority_change
-        self._on_input_needed = on_input_needed
-        self._on_both_passed = on_both_passed
+        self._on_priority_change = on_priority_change or _noop
+        self._on_input_needed = on_input_needed or _noop
+        self._on_both_passed = on_both_passed or _noop
 
     def reset_for_phase(self, turn_player: int):
         """
@@ -163,21 +262,26 @@ class PriorityManager:
         """
         self.turn_player = turn_player
         self.active_player = turn_player
-        self.player_passed = [False, False]
+        self._passed_bits = 0
         self.state = PriorityState.ACTIVE
         self.pending_action = None
-        self.action_history = []
+        self.action_history.clear()
 
         self._notify_priority_change()
 
     def reset_passes(self):
         """Reset pass tracking (after an action is taken)."""
-        self.player_passed = [False, False]
+        self._passed_bits = 0
+
+    @property
+    def player_passed(self) -> List[bool]:
+        """Whether each player has passed in the current sequence."""
+        bits = self._passed_bits
+        return [bool(bits & 1), bool(bits & 2)]
 
     def has_priority(self, player: int) -> bool:
         """Check if a player currently has priority."""
-        return (self.state == PriorityState.ACTIVE and
-                self.active_player == player)
+        return self.active_player == player and self.state is _STATE_ACTIVE
 
     def is_main_timing(self, player: int) -> bool:
         """
@@ -189,13 +293,12 @@ class PriorityManager:
         - Not in battle
         - Chase area is empty
         """
-        from ..engine import Phase
-
+        game = self.game
         return (
-            self.game.turn_player == player and
-            self.game.current_phase == Phase.MAIN and
-            not self.game.battle.in_battle and
-            len(self.game.chase) == 0
+            game.turn_player == player and
+            game.current_phase == Phase.MAIN and
+            not game.battle.in_battle and
+            len(game.chase) == 0
         )
 
     def can_take_action(self, player: int, action_type: ActionType) -> bool:
@@ -208,51 +311,25 @@ class PriorityManager:
         if not self.has_priority(player):
             return False
 
-        # Check main timing requirements
-        if action_type in (ActionType.CALL_STONE, ActionType.JUDGMENT):
-            return self.is_main_timing(player)
-
-        if action_type == ActionType.ATTACK:
-            from ..engine import Phase
-            return (self.game.current_phase == Phase.BATTLE and
-                    self.game.turn_player == player)
+        can_block = (self.game.battle.in_battle and
+                     self.game.turn_player != player)
+        mask = self._LEGAL_MASKS[self.is_main_timing(player), can_block]
+        return bool(mask >> action_type & 1)
 
-        if action_type == ActionType.BLOCK:
-            from ..engine import Phase
-            return (self.game.current_phase == Phase.BATTLE and
-                    self.game.turn_player != player and
-                    self.game.battle.in_battle)
-
-        return True
+    def get_legal_actions(self, player: int) -> Tuple[ActionType, ...]:
+        """
+        Get all legal action types for a player.
 
-    def get_legal_actions(self, player: int) -> List[ActionType]:
-        """Get all legal action types for a player."""
+        The result depends only on main timing and whether the player is
+        defending in a battle, so it is one of the shared _LEGAL_TABLE
+        tuples. Attacks are declared at main timing (battle happens
+        during the main phase); blocks by the non-turn player in battle.
+        """
         if not self.has_priority(player):
-            return []
-
-        actions = [ActionType.PASS]
-
-        # Always can produce will if able
-        actions.append(ActionType.PRODUCE_WILL)
-
-        # Instant-speed actions (anytime with priority)
-        actions.append(ActionType.PLAY_CARD)
-        actions.append(ActionType.ACTIVATE_ABILITY)
-
-        # Main timing actions
-        if self.is_main_timing(player):
-            actions.append(ActionType.CALL_STONE)
-            actions.append(ActionType.JUDGMENT)
-
-        # Battle actions
-        from ..engine import Phase
-        if self.game.current_phase == Phase.BATTLE:
-            if self.game.turn_player == player:
-                actions.append(ActionType.ATTACK)
-            else:
-                actions.append(ActionType.BLOCK)
-
-        return actions
+            return ()
+        can_block = (self.game.battle.in_battle and
+                     self.game.turn_player != player)
+        return self._LEGAL_TABLE[self.is_main_timing(player), can_block]
 
     def take_action(self, player: int, action_type: ActionType,
                     source: 'Card' = None, **kwargs) -> bool:
@@ -264,48 +341,42 @@ class PriorityManager:
 
         Returns True if action was started, False if illegal.
         """
-        if not self.can_take_action(player, action_type):
+        ctx = self._action_context(player)
+        if not ctx.has_priority:
             return False
 
-        if action_type == ActionType.PASS:
-            return self._handle_pass(player)
-
-        if action_type == ActionType.PRODUCE_WILL:
-            return self._handle_produce_will(player, source, **kwargs)
-
-        if action_type == ActionType.PLAY_CARD:
-            return self._handle_play_card(player, source, **kwargs)
-
-        if action_type == ActionType.ACTIVATE_ABILITY:
-            return self._handle_activate_ability(player, source, **kwargs)
-
-        if action_type == ActionType.CALL_STONE:
-            return self._handle_call_stone(player, **kwargs)
-
-        if action_type == ActionType.JUDGMENT:
-            return self._handle_judgment(player, **kwargs)
-
-        if action_type == ActionType.ATTACK:
-            return self._handle_attack(player, source, **kwargs)
-
-        if action_type == ActionType.BLOCK:
-            return self._handle_block(player, source, **kwargs)
+        can_block = ctx.in_battle and self.game.turn_player != player
+        if not self._LEGAL_MASKS[ctx.is_main_timing, can_block] >> action_type & 1:
+            return False
 
-        return False
+        handler = self._action_dispatch.get(action_type)
+        if handler is None:
+            return False
+        return handler(ctx, source, **kwargs)
+
+    def _action_context(self, player: int) -> ActionContext:
+        """Snapshot the timing state a handler needs for one action."""
+        return ActionContext(
+            player=player,
+            has_priority=self.has_priority(player),
+            is_main_timing=self.is_main_timing(player),
+            in_battle=self.game.battle.in_battle,
+        )
 
-    def _handle_pass(self, player: int) -> bool:
+    def _handle_pass(self, ctx: ActionContext, source: 'Card' = None, **kwargs) -> bool:
         """
         Handle a player passing priority.
 
         CR 605.3: When a player passes, opponent receives priority.
         CR 605.4: When both pass consecutively, resolve chase or advance.
         """
-        self.player_passed[player] = True
+        player = ctx.player
+        self._passed_bits |= 1 << player
         self.action_history.append((player, ActionType.PASS))
 
-        opponent = 1 - player
+        opponent = _OPPONENT[player]
 
-        if self.player_passed[opponent]:
+        if self._passed_bits == 0b11:
             # Both players have passed
             self.state = PriorityState.BOTH_PASSED
             self._handle_both_passed()
@@ -325,8 +396,7 @@ class PriorityManager:
         - If chase has items: resolve top item
         - If chase empty: advance to next step/phase
         """
-        if self._on_both_passed:
-            self._on_both_passed()
+        self._on_both_passed()
 
         if self.game.chase:
             # Resolve top chase item
@@ -342,7 +412,7 @@ class PriorityManager:
 
         CR 707.4: After resolution, active player receives priority again.
         """
-        self.player_passed = [False, False]
+        self._passed_bits = 0
         self.active_player = self.turn_player
         self.state = PriorityState.ACTIVE
         self._notify_priority_change()
@@ -354,17 +424,18 @@ class PriorityManager:
         CR 605.3: After playing something, opponent receives priority.
         """
         self.reset_passes()
-        opponent = 1 - player
+        opponent = _OPPONENT[player]
         self.active_player = opponent
         self.state = PriorityState.ACTIVE
         self._notify_priority_change()
 
-    def _handle_produce_will(self, player: int, source: 'Card', **kwargs) -> bool:
+    def _handle_produce_will(self, ctx: ActionContext, source: 'Card', **kwargs) -> bool:
         """
         Handle will production.
 
         CR 907.3: Will abilities don't use the chase.
         """
+        player = ctx.player
         if not source:
             return False
 
@@ -382,7 +453,7 @@ class PriorityManager:
                 action_type=ActionType.PRODUCE_WILL,
                 source=source,
                 player=player,
-                needs_will_choice=True,
+                needs_bits=NEEDS_WILL_CHOICE,
                 will_colors=colors,
             )
             self.state = PriorityState.WAITING_INPUT
@@ -401,22 +472,22 @@ class PriorityManager:
 
         return True
 
-    def _handle_play_card(self, player: int, source: 'Card', **kwargs) -> bool:
+    def _handle_play_card(self, ctx: ActionContext, source: 'Card', **kwargs) -> bool:
         """
         Handle playing a card.
 
         CR 903.2: Choose targets and modes when playing.
         """
+        player = ctx.player
         if not source:
             return False
 
         # Validate timing
-        from ..models import CardType
         card_type = source.data.card_type if source.data else None
 
         # Check if instant-speed or main timing required
         is_instant = self._card_is_instant_speed(source)
-        if not is_instant and not self.is_main_timing(player):
+        if not is_instant and not ctx.is_main_timing:
             return False
 
         # Check if can pay cost
@@ -435,7 +506,7 @@ class PriorityManager:
                 action_type=ActionType.PLAY_CARD,
                 source=source,
                 player=player,
-                needs_targets=True,
+                needs_bits=NEEDS_TARGETS,
                 target_requirements=target_reqs,
             )
             self.state = PriorityState.WAITING_INPUT
@@ -449,8 +520,6 @@ class PriorityManager:
 
     def _finalize_play_card(self, player: int, source: 'Card', targets: List['Card']):
         """Finalize playing a card (pay cost, add to chase)."""
-        from ..models import Zone, ChaseItem
-
         # Pay cost
         if source.data and source.data.cost:
             self.game.players[player].will_pool.pay(source.data.cost)
@@ -460,6 +529,7 @@ class PriorityManager:
 
         # Add to chase
         item = ChaseItem(
+            uid=str(uuid.uuid4()),
             source=source,
             controller=player,
             item_type="SPELL",
@@ -469,8 +539,9 @@ class PriorityManager:
 
         self.after_action(player)
 
-    def _handle_activate_ability(self, player: int, source: 'Card', **kwargs) -> bool:
+    def _handle_activate_ability(self, ctx: ActionContext, source: 'Card', **kwargs) -> bool:
         """Handle activating an ability."""
+        player = ctx.player
         if not source:
             return False
 
@@ -492,41 +563,36 @@ class PriorityManager:
             return False
 
         # Check targeting
-        if hasattr(ability, 'target_requirements') and ability.target_requirements:
-            if 'targets' not in kwargs:
-                self.pending_action = PendingAction(
-                    action_type=ActionType.ACTIVATE_ABILITY,
-                    source=source,
-                    player=player,
-                    needs_targets=True,
-                    target_requirements=ability.target_requirements,
-                    ability_index=ability_index,
-                )
-                self.state = PriorityState.WAITING_INPUT
-                self._notify_input_needed()
-                return True
+        if ability.target_requirements and 'targets' not in kwargs:
+            self.pending_action = PendingAction(
+                action_type=ActionType.ACTIVATE_ABILITY,
+                source=source,
+                player=player,
+                needs_bits=NEEDS_TARGETS,
+                target_requirements=ability.target_requirements,
+                ability=ability,
+                ability_index=ability_index,
+            )
+            self.state = PriorityState.WAITING_INPUT
+            self._notify_input_needed()
+            return True
 
         targets = kwargs.get('targets', [])
-        self._finalize_activate_ability(player, source, ability_index, targets)
+        self._finalize_activate_ability(player, source, ability, ability_index, targets)
         return True
 
-    def _finalize_activate_ability(self, player: int, source: 'Card',
+    def _finalize_activate_ability(self, player: int, source: 'Card', ability: Any,
                                     ability_index: int, targets: List['Card']):
-        """Finalize activating an ability."""
-        from ..models import ChaseItem
-
-        script = self.game.get_script(source)
-        abilities = script.get_activated_abilities(self.game, source)
-        ability = abilities[ability_index]
-
+        """Finalize activating an ability already resolved by the handler."""
         # Pay costs
-        if hasattr(ability, 'tap_cost') and ability.tap_cost:
+        if ability.tap_cost:
             source.is_rested = True
-        if hasattr(ability, 'will_cost') and ability.will_cost:
+        if ability.will_cost:
             self.game.players[player].will_pool.pay(ability.will_cost)
 
         # Add to chase
         item = ChaseItem(
+            uid=str(uuid.uuid4()),
             source=source,
             controller=player,
             item_type="ABILITY",
@@ -537,8 +603,9 @@ class PriorityManager:
 
         self.after_action(player)
 
-    def _handle_call_stone(self, player: int, **kwargs) -> bool:
+    def _handle_call_stone(self, ctx: ActionContext, source: 'Card' = None, **kwargs) -> bool:
         """Handle calling a magic stone."""
+        player = ctx.player
         p = self.game.players[player]
 
         if p.has_called_stone:
@@ -549,19 +616,18 @@ class PriorityManager:
 
         # Call the top stone
         stone = p.stone_deck.pop(0)
-        from ..models import Zone
         self.game.move_card(stone, Zone.FIELD, player)
         p.has_called_stone = True
 
-        from ..engine import EventType
         self.game.emit(EventType.STONE_CALLED, player, stone)
 
         # Stone calling doesn't use the chase but resets passes
         self.reset_passes()
         return True
 
-    def _handle_judgment(self, player: int, **kwargs) -> bool:
+    def _handle_judgment(self, ctx: ActionContext, source: 'Card' = None, **kwargs) -> bool:
         """Handle performing Judgment."""
+        player = ctx.player
         p = self.game.players[player]
 
         if not p.ruler or p.has_j_ruled:
@@ -577,21 +643,20 @@ class PriorityManager:
             p.will_pool.pay(j_cost)
 
         # Add Judgment to chase
-        from ..models import ChaseItem
         item = ChaseItem(
+            uid=str(uuid.uuid4()),
             source=p.ruler,
             controller=player,
             item_type="JUDGMENT",
         )
         self.game.add_to_chase(item)
 
-        from ..engine import EventType
         self.game.emit(EventType.JUDGMENT, player, p.ruler)
 
         self.after_action(player)
         return True
 
-    def _handle_attack(self, player: int, source: 'Card', **kwargs) -> bool:
+    def _handle_attack(self, ctx: ActionContext, source: 'Card', **kwargs) -> bool:
         """Handle declaring an attack."""
         if not source:
             return False
@@ -600,7 +665,6 @@ class PriorityManager:
         if source.is_rested:
             return False
 
-        from ..models import Keyword
         if source.entered_turn == self.game.turn_number:
             if not source.has_keyword(Keyword.SWIFTNESS):
                 return False
@@ -611,7 +675,7 @@ class PriorityManager:
 
         return True
 
-    def _handle_block(self, player: int, source: 'Card', **kwargs) -> bool:
+    def _handle_block(self, ctx: ActionContext, source: 'Card', **kwargs) -> bool:
         """Handle declaring a block."""
         if not source:
             return False
@@ -632,21 +696,24 @@ class PriorityManager:
             return False
 
         action = self.pending_action
+        needs = action.needs_bits
 
-        if action.needs_targets and 'targets' in kwargs:
+        if needs & NEEDS_TARGETS and 'targets' in kwargs:
             action.selected_targets = kwargs['targets']
-            action.needs_targets = False
+            needs &= ~NEEDS_TARGETS
 
-        if action.needs_modes and 'modes' in kwargs:
+        if needs & NEEDS_MODES and 'modes' in kwargs:
             action.selected_modes = kwargs['modes']
-            action.needs_modes = False
+            needs &= ~NEEDS_MODES
 
-        if action.needs_will_choice and 'color' in kwargs:
+        if needs & NEEDS_WILL_CHOICE and 'color' in kwargs:
             action.selected_color = kwargs['color']
-            action.needs_will_choice = False
+            needs &= ~NEEDS_WILL_CHOICE
+
+        action.needs_bits = needs
 
         # Check if all input received
-        if not (action.needs_targets or action.needs_modes or action.needs_will_choice):
+        if not needs:
             self._complete_pending_action()
 
         return True
@@ -668,7 +735,7 @@ class PriorityManager:
 
         if action.action_type == ActionType.PRODUCE_WILL:
             self._handle_produce_will(
-                action.player, action.source,
+                self._action_context(action.player), action.source,
                 color=action.selected_color
             )
 
@@ -680,7 +747,7 @@ class PriorityManager:
 
         elif action.action_type == ActionType.ACTIVATE_ABILITY:
             self._finalize_activate_ability(
-                action.player, action.source,
+                action.player, action.source, action.ability,
                 action.ability_index, action.selected_targets
             )
 
@@ -689,21 +756,12 @@ class PriorityManager:
         if not card.data:
             return False
 
-        from ..models import CardType, Keyword
-
-        # Chant-Instant is always instant
-        if card.data.card_type == CardType.CHANT_INSTANT:
-            return True
-
-        # Quickcast keyword
-        if card.has_keyword(Keyword.QUICKCAST):
-            return True
-
-        # Check for Quickcast in ability text
-        if card.data.ability_text and 'quickcast' in card.data.ability_text.lower():
+        # Chant-Instant, or Quickcast in the printed text
+        if _data_is_instant_speed(card.data.card_type, card.data.ability_text):
             return True
 
-        return False
+        # Quickcast keyword (may be granted at runtime, so never cached)
+        return card.has_keyword(Keyword.QUICKCAST)
 
     def _can_pay_cost(self, player: int, card: 'Card') -> bool:
         """Check if player can pay a card's cost."""
@@ -714,10 +772,9 @@ class PriorityManager:
 
     def _notify_priority_change(self):
         """Notify that priority has changed."""
-        if self._on_priority_change:
-            self._on_priority_change(self.active_player, self.state)
+        self._on_priority_change(self.active_player, self.state)
 
     def _notify_input_needed(self):
         """Notify that input is needed."""
-        if self._on_input_needed and self.pending_action:
+        if self.pending_action:
             self._on_input_needed(self.pending_action)
@@ -9,7 +9,7 @@ References:
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Optional, Set, Callable, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..models import Card, Attribute, CardType
@@ -141,7 +141,7 @@ class TargetFilter:
 
         # Check races
         if self.races:
-            card_races = card.data.race.split('/') if card.data and card.data.race else []
+            card_races = card.data.races if card.data else []
             card_races = [r.strip().lower() for r in card_races]
             if not any(r.lower() in card_races for r in self.races):
                 return False
@@ -169,7 +169,7 @@ class TargetFilter:
 
         # Check total cost
         if card.data and card.data.cost:
-            total_cost = card.data.cost.total()
+            total_cost = card.data.cost.total
             if self.min_total_cost is not None and total_cost < self.min_total_cost:
                 return False
             if self.max_total_cost is not None and total_cost > self.max_total_cost:
@@ -222,6 +222,19 @@ class TargetFilter:
 
         return True
 
+    def narrow(self, cards: List['Card'],
+               cards_by_race: Dict[str, List['Card']]) -> List['Card']:
+        """
+        Pick the cards worth running matches() on.
+
+        cards_by_race maps each lowercased race to the cards in cards
+        that have it. Only single-race filters are narrowed; the result
+        still has to be checked with matches().
+        """
+        if self.races and len(self.races) == 1:
+            return cards_by_race.get(self.races[0].lower(), [])
+        return cards
+
 
 @dataclass
 class TargetRequirement:
@@ -11,6 +11,7 @@ References:
 - CR 906.9: State triggers (intervening-if)
 """
 
+import uuid
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, List, Optional, Dict, Callable, Any, Tuple
@@ -172,6 +173,10 @@ class APNAPTriggerManager:
     This means they RESOLVE in reverse order: non-active player's
     triggers resolve first.
     """
+    __slots__ = (
+        'game', 'triggers', '_by_cond', '_by_cond_stale', 'pending',
+        'delayed', '_timestamp', 'on_registry_change', '_apnap_order',
+    )
 
     def __init__(self, game: 'GameEngine'):
         self.game = game
@@ -179,6 +184,11 @@ class APNAPTriggerManager:
         # Registered triggers per card
         self.triggers: Dict[str, List[TriggeredAbility]] = {}
 
+        # Same triggers indexed by condition as (card_uid, ability), in
+        # registration order. Rebuilt lazily after (un)registration.
+        self._by_cond: Dict[TriggerCondition, List[Tuple[str, TriggeredAbility]]] = {}
+        self._by_cond_stale = False
+
         # Pending trigger instances waiting to go on chase
         self.pending: List[TriggerInstance] = []
 
@@ -188,16 +198,46 @@ class APNAPTriggerManager:
         # Timestamp counter for ordering same-time triggers
         self._timestamp = 0
 
+        # Called when the registry becomes empty or non-empty
+        self.on_registry_change: Optional[Callable[[], None]] = None
+
+        # (turn player, APNAP player order) for the current turn
+        self._apnap_order: Optional[Tuple[int, Tuple[int, ...]]] = None
+
     def register_trigger(self, card: 'Card', ability: TriggeredAbility):
         """Register a triggered ability for a card."""
+        was_empty = not self.triggers
         if card.uid not in self.triggers:
             self.triggers[card.uid] = []
         self.triggers[card.uid].append(ability)
+        self._by_cond_stale = True
+        if was_empty and self.on_registry_change:
+            self.on_registry_change()
 
     def unregister_triggers(self, card: 'Card'):
         """Unregister all triggers for a card."""
         if card.uid in self.triggers:
             del self.triggers[card.uid]
+            self._by_cond_stale = True
+            if not self.triggers and self.on_registry_change:
+                self.on_registry_change()
+
+    def _rebuild_cond_index(self):
+        """Rebuild the per-condition index from the per-card registry."""
+        by_cond: Dict[TriggerCondition, List[Tuple[str, TriggeredAbility]]] = {}
+        for card_uid, abilities in self.triggers.items():
+            for ability in abilities:
+                by_cond.setdefault(ability.trigger_condition, []).append(
+                    (card_uid, ability))
+        self._by_cond = by_cond
+        self._by_cond_stale = False
+
+    def subscribers(self, event_type: TriggerCondition
+                    ) -> List[Tuple[str, TriggeredAbility]]:
+        """Get (card_uid, ability) pairs registered for a trigger condition."""
+        if self._by_cond_stale:
+            self._rebuild_cond_index()
+        return self._by_cond.get(event_type, [])
 
     def check_triggers(self, event_type: TriggerCondition,
                        event_data: Dict[str, Any]):
@@ -208,23 +248,42 @@ class APNAPTriggerManager:
         """
         self._timestamp += 1
 
-        # Check all registered triggers
-        for card_uid, abilities in self.triggers.items():
+        # Only abilities watching this condition can trigger
+        self._collect_triggers(self.subscribers(event_type), event_type, event_data)
+
+    def check_triggers_bulk(self, event_type: TriggerCondition,
+                            events: List[Tuple[List[Tuple[str, TriggeredAbility]],
+                                               Dict[str, Any]]]):
+        """
+        Check several deferred events of the same condition, in order.
+
+        Each event comes with the subscribers() list captured when it was
+        emitted, so abilities unregistered since (e.g. the card left the
+        field) still see the events that happened while they were there.
+        """
+        for subscribers, event_data in events:
+            self._timestamp += 1
+            self._collect_triggers(subscribers, event_type, event_data)
+
+    def _collect_triggers(self, subscribers: List[Tuple[str, TriggeredAbility]],
+                          event_type: TriggerCondition,
+                          event_data: Dict[str, Any]):
+        """Create pending instances for subscribers that trigger on an event."""
+        for card_uid, ability in subscribers:
             card = self.game.get_card(card_uid)
             if not card:
                 continue
 
-            for ability in abilities:
-                if ability.can_trigger(self.game, card, event_type, event_data):
-                    instance = TriggerInstance(
-                        ability=ability,
-                        source=card,
-                        controller=card.controller,
-                        event_data=dict(event_data),
-                        trigger_turn=self.game.turn_number,
-                        timestamp=self._timestamp,
-                    )
-                    self.pending.append(instance)
+            if ability.can_trigger(self.game, card, event_type, event_data):
+                instance = TriggerInstance(
+                    ability=ability,
+                    source=card,
+                    controller=card.controller,
+                    event_data=dict(event_data),
+                    trigger_turn=self.game.turn_number,
+                    timestamp=self._timestamp,
+                )
+                self.pending.append(instance)
 
     def order_pending_triggers(self) -> List[TriggerInstance]:
         """
@@ -236,27 +295,44 @@ class APNAPTriggerManager:
         if not self.pending:
             return []
 
-        active_player = self.game.turn_player
-        non_active = 1 - active_player
-
-        # Separate by controller
-        active_triggers = [t for t in self.pending if t.controller == active_player]
-        non_active_triggers = [t for t in self.pending if t.controller == non_active]
+        order = self.get_apnap_order()
 
-        # Within each player, order by timestamp (older first)
-        active_triggers.sort(key=lambda t: t.timestamp)
-        non_active_triggers.sort(key=lambda t: t.timestamp)
-
-        # If player controls multiple, they choose order
-        # For AI, we use timestamp order
-        active_triggers = self._player_orders_triggers(active_player, active_triggers)
-        non_active_triggers = self._player_orders_triggers(non_active, non_active_triggers)
+        # Separate by controller in one pass
+        by_player = {p: [] for p in order}
+        for t in self.pending:
+            bucket = by_player.get(t.controller)
+            if bucket is not None:
+                bucket.append(t)
 
         # APNAP: Active player's go on first (resolve last)
-        ordered = active_triggers + non_active_triggers
+        ordered = []
+        for p in order:
+            triggers = by_player[p]
+            # Within each player, order by timestamp (older first)
+            triggers.sort(key=lambda t: t.timestamp)
+            # If player controls multiple, they choose order
+            # For AI, we use timestamp order
+            ordered.extend(self._player_orders_triggers(p, triggers))
 
         return ordered
 
+    def get_apnap_order(self) -> Tuple[int, ...]:
+        """
+        Get player indices in APNAP order (active player first).
+
+        Cached until the turn player changes.
+        """
+        active_player = self.game.turn_player
+        cached = self._apnap_order
+        if cached is None or cached[0] != active_player:
+            order = (active_player, 1 - active_player)
+            self._apnap_order = cached = (active_player, order)
+        return cached[1]
+
+    def clear_order_cache(self):
+        """Drop the cached APNAP order (e.g. after a turn-player change)."""
+        self._apnap_order = None
+
     def _player_orders_triggers(self, player: int,
                                 triggers: List[TriggerInstance]
                                 ) -> List[TriggerInstance]:
@@ -295,6 +371,7 @@ class APNAPTriggerManager:
                 instance.intervening_checked = False
 
             item = ChaseItem(
+                uid=str(uuid.uuid4()),
                 source=instance.source,
                 controller=instance.controller,
                 item_type="TRIGGER",
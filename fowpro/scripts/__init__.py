@@ -127,6 +127,10 @@ class Effect:
     # Internal tracking
     _activated_this_turn: bool = field(default=False, repr=False)
 
+    # Script effects pick targets through `target`; they have no
+    # declarative requirements (class attribute, not a field)
+    target_requirements = ()
+
 
 # =============================================================================
 # CARD SCRIPT BASE CLASS
@@ -0,0 +1,30 @@
+"""Tests for the dict-compatible replacement event payloads."""
+
+import unittest
+
+from fowpro.rules.effects import DamageEvent, DestroyEvent
+
+
+class ReplacementEventMappingTest(unittest.TestCase):
+
+    def test_setitem_writes_field(self):
+        event = DamageEvent(amount=300)
+        event['amount'] = 100
+        self.assertEqual(event.amount, 100)
+        self.assertEqual(event['amount'], 100)
+        self.assertEqual(event.copy()['amount'], 100)
+
+    def test_setitem_unknown_key_raises_key_error(self):
+        event = DamageEvent(amount=300)
+        with self.assertRaises(KeyError):
+            event['prevented'] = True
+        with self.assertRaises(KeyError):
+            DestroyEvent()['amount'] = 100
+
+    def test_getitem_unknown_key_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            DestroyEvent()['amount']
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Regression tests for trigger checks during state-based actions."""
+
+import contextlib
+import io
+import unittest
+
+from fowpro.engine import GameEngine
+from fowpro.models import Card, CardData, CardType, Attribute, WillCost, Zone
+from fowpro.rules.triggers import TriggeredAbility
+from fowpro.rules.types import TriggerCondition
+
+
+class _RecordingTrigger(TriggeredAbility):
+    """Triggered ability that records each condition it triggered on."""
+
+    def __init__(self, condition, fired):
+        super().__init__(name=condition.name, trigger_condition=condition)
+        self.fired = fired
+
+    def can_trigger(self, game, source, event_type, event_data):
+        if super().can_trigger(game, source, event_type, event_data):
+            self.fired.append(event_type)
+            return True
+        return False
+
+
+class SBADestroyedTriggerTest(unittest.TestCase):
+
+    def test_resonator_destroyed_by_sba_fires_own_triggers(self):
+        engine = GameEngine()
+        rules = engine._get_rules_engine()
+        # Settle the layer system on the empty field first
+        rules.apply_continuous_effects()
+
+        data = CardData(code="TEST-001", name="Doomed", card_type=CardType.RESONATOR,
+                        attribute=Attribute.FIRE, cost=WillCost(fire=1),
+                        atk=100, defense=100)
+        card = Card(uid="doomed", data=data, owner=0, controller=0, zone=Zone.FIELD)
+        engine.players[0].field.append(card)
+        engine._all_cards[card.uid] = card
+
+        fired = []
+        for condition in (TriggerCondition.DESTROYED, TriggerCondition.LEAVE_FIELD):
+            rules.triggers.register_trigger(card, _RecordingTrigger(condition, fired))
+
+        card.damage = 100
+        with contextlib.redirect_stdout(io.StringIO()):
+            rules.run_state_based_actions_enhanced()
+
+        self.assertNotEqual(card.zone, Zone.FIELD)
+        self.assertEqual(fired, [TriggerCondition.DESTROYED, TriggerCondition.LEAVE_FIELD])
+
+
+if __name__ == "__main__":
+    unittest.main()